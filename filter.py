@@ -8,6 +8,7 @@ Stage 1 (unchanged from your pipeline):
   Mechanical Ventilation + Weaning (MV+Weaning) papers.
 - Outputs:
   - paper_list/normalized/unified_all.jsonl / unified_all.csv
+  - paper_list/normalized/clusters.json                       (records sharing a DOI/PMID/PMCID/MAG/arXiv id)
   - paper_list/normalized/screened_candidates.csv             (pass MV+Weaning filter)
   - paper_list/normalized/excluded_non_mv_weaning.csv         (auto-excluded with reason)
   - paper_list/normalized/prisma_counts.json                  (counts)
@@ -31,16 +32,57 @@ Stage 2 (NEW):
 """
 
 from pathlib import Path
-import json, csv, re, time, xml.etree.ElementTree as ET
+import json, csv, gzip, mmap, os, random, re, string, sys, time, threading, sqlite3, zlib
+from io import BytesIO
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import requests  # NEW
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+try:
+    import ahocorasick  # optional (pip install pyahocorasick): single-pass Stage 1 keyword scan
+except ImportError:
+    ahocorasick = None
+try:
+    from lxml import etree as ET  # optional (pip install lxml): C-speed XML parsing, same find/findtext API
+except ImportError:
+    import xml.etree.ElementTree as ET
+LXML = hasattr(ET, "LXML_VERSION")  # lxml's iterparse can filter by tag in C
+try:
+    import orjson  # optional (pip install orjson): faster JSON for raw files, JSONL and API payloads
+except ImportError:
+    orjson = None
+try:
+    import ijson  # optional (pip install ijson): stream raw JSON arrays instead of loading whole files
+except ImportError:
+    ijson = None
+try:
+    import zstandard  # optional (pip install zstandard): read SEARCH_ZSTD_RAW=1 raw dumps
+except ImportError:
+    zstandard = None
+try:
+    import pyarrow as pa, pyarrow.parquet as pq  # optional (pip install pyarrow): columnar unified_all.parquet
+except ImportError:
+    pa = pq = None
+try:
+    import re2  # optional (pip install google-re2): linear-time DFA matching for the keyword patterns
+except ImportError:
+    re2 = None
+
+load_dotenv()  # NCBI_API_KEY / SEMANTIC_SCHOLAR_API_KEY, as for paper_search.py
 
 RAW = Path("paper_list/raw")
+ABSTRACT_CACHE = Path("paper_list/cache/abstracts.sqlite")  # fetched abstracts survive reruns
+REFRESH_ABSTRACTS = False  # True: ignore cached abstracts and refetch (fresh results are still cached)
 OUT = Path("paper_list/normalized")
 OUT.mkdir(parents=True, exist_ok=True)
 
 # ------------------ tuning knobs ------------------
 STRICT_REQUIRE_RL = False  # Stage 1 only: set True to ALSO require RL keyword match in title/snippet screen
 CASE_SENSITIVE = False     # keyword matching is case-insensitive by default
+NEAR_DUP_THRESHOLD = 0.85  # title 3-gram Jaccard at which dedup folds near-duplicates (None/0 = off)
 
 # RL keywords (already in your search, but kept here if you switch sources later)
 RL_TERMS = [
@@ -61,62 +103,290 @@ WEAN_TERMS = [
 
 # --------------------------------------------------
 
-def read_json(path: Path):
-    if not path.exists(): return None
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+def json_dumps(obj) -> bytes:
+    """
+    UTF-8 JSON bytes: compact from orjson when it is installed; otherwise stdlib json with
+    its default separators, so files written without orjson match the pre-orjson output byte for byte.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+def json_line(obj) -> bytes:
+    """json_dumps(obj) + b"\n"; orjson appends the newline itself instead of copying the bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json_dumps(obj) + b"\n"
+
+def json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+MMAP_MIN_BYTES = 64 << 20  # raw files at least this big are parsed from a read-only mmap
+
+RAW_COMPRESSED = (".gz", ".zst")  # SEARCH_GZIP_RAW / SEARCH_ZSTD_RAW dumps
+
+def raw_file(path: Path) -> Path:
+    """`path`, or its compressed sibling `path.gz` / `path.zst` when only that exists."""
+    if path.exists():
+        return path
+    for suffix in RAW_COMPRESSED:
+        packed = path.with_name(path.name + suffix)
+        if packed.exists():
+            return packed
+    return path
+
+def open_compressed(path: Path):
+    """Decompressing binary reader for a .gz or .zst raw dump."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    if zstandard is None:
+        raise ImportError(f"{path} needs zstandard (pip install zstandard)")
+    return zstandard.ZstdDecompressor().stream_reader(path.open("rb"))
 
-def write_jsonl(path: Path, rows):
-    with path.open("w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+def read_json(path: Path):
+    # one read of raw bytes straight into the parser; a missing or empty file means no data
+    path = raw_file(path)
+    if path.suffix in RAW_COMPRESSED:
+        with open_compressed(path) as f:
+            data = f.read()
+        return json_loads(data) if data else None
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return None
+        if orjson is not None and size >= MMAP_MIN_BYTES:
+            # orjson reads the page-cache-backed mapping directly, no heap copy of the whole file
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mm = None  # mmap unavailable here: fall through to a plain read
+            if mm is not None:
+                with mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+        return json_loads(f.read())
+
+def select_path(node, parts):
+    """Values at an ijson-style path in loaded JSON; an 'item' step fans out over list elements."""
+    if not parts:
+        yield node
+        return
+    head, rest = parts[0], parts[1:]
+    if head == "item":
+        if isinstance(node, list):
+            for v in node:
+                yield from select_path(v, rest)
+    elif isinstance(node, dict) and head in node:
+        yield from select_path(node[head], rest)
+
+def iter_items(path: Path, *prefixes):
+    """
+    Yield the elements of the first non-empty array(s) found at one of `prefixes`
+    (ijson paths such as "items", "search-results.entry" or
+    "pages.item.payload.Data.Records"). Streams record by record with ijson
+    when installed; otherwise falls back to read_json.
+    """
+    path = raw_file(path)
+    packed = path.suffix in RAW_COMPRESSED
+    try:
+        if path.stat().st_size == 0: return  # missing or empty: no data
+    except FileNotFoundError:
+        return
+    if packed:
+        with open_compressed(path) as f:
+            if not f.read(1): return  # compressed empty file
+    if ijson is None:
+        data = read_json(path) or {}
+        for prefix in prefixes:
+            found = False
+            for arr in select_path(data, prefix.split(".")):
+                if isinstance(arr, list):
+                    for obj in arr:
+                        found = True
+                        yield obj
+            if found:
+                return
+        return
+    for prefix in prefixes:
+        found = False
+        with (open_compressed(path) if packed else path.open("rb")) as f:
+            for obj in ijson.items(f, prefix + ".item", use_float=True):
+                found = True
+                yield obj
+        if found:
+            return
+
+def csv_row(r, cols):
+    # Positional row in `cols` order; keys not listed (e.g. 'extra', 'match_mv') are ignored
+    row = []
+    for c in cols:
+        v = r.get(c, "")
+        if c == "authors" and isinstance(v, list):
+            v = "; ".join(v)
+        row.append(v)
+    return row
+
+WRITE_BUFFER = 1 << 20  # 1 MiB file buffers: output files are written in a few large syscalls
 
 def write_csv(path: Path, rows, cols):
-    with path.open("w", newline="", encoding="utf-8") as f:
-        # Ignore any keys not listed in `cols` (e.g., 'extra', 'auto_exclude_reason', 'match_mv', etc.)
-        w = csv.DictWriter(f, fieldnames=cols, extrasaction="ignore")
-        w.writeheader()
+    with path.open("w", newline="", encoding="utf-8", buffering=WRITE_BUFFER) as f:
+        w = csv.writer(f)
+        w.writerow(cols)
+        w.writerows(csv_row(r, cols) for r in rows)
+
+def write_jsonl_csv(jsonl_path: Path, csv_path: Path, rows, cols, batch=1024):
+    """
+    Write the same rows to JSONL and CSV in one pass; rows may be a generator.
+    Lines are flushed in blocks of `batch` rows (one join + write per block)
+    so a streamed input is never held in full.
+    """
+    with jsonl_path.open("wb", buffering=WRITE_BUFFER) as fj, \
+         csv_path.open("w", newline="", encoding="utf-8", buffering=WRITE_BUFFER) as fc:
+        w = csv.writer(fc)
+        w.writerow(cols)
+        lines, table = [], []
+        def flush():
+            fj.write(b"".join(lines))
+            w.writerows(table)
+            lines.clear()
+            table.clear()
         for r in rows:
-            rr = r.copy()
-            if isinstance(rr.get("authors"), list):
-                rr["authors"] = "; ".join(rr["authors"])
-            w.writerow(rr)
+            lines.append(json_line(r))
+            table.append(csv_row(r, cols))
+            if len(lines) >= batch:
+                flush()
+        flush()
+
+def write_parquet(path: Path, rows, cols):
+    """
+    Columnar copy of `rows`: one list per column, authors as list<string>,
+    year as a nullable int, dictionary-encoded and zstd-compressed.
+    No-op when pyarrow is not installed; JSONL/CSV remain the primary outputs.
+    """
+    if pa is None: return
+    columns = {c: [] for c in cols}
+    for r in rows:
+        for c in cols:
+            v = r.get(c, "")
+            if c == "authors":
+                v = [str(a) for a in v] if isinstance(v, list) else ([str(v)] if v else [])
+            elif c == "year":
+                v = v if isinstance(v, int) else None
+            else:
+                v = "" if v is None else str(v)
+            columns[c].append(v)
+    pq.write_table(pa.table(columns), str(path), compression="zstd")
 
 def normalize_text(s):
-    return re.sub(r"\s+", " ", s or "").strip()
+    # collapse whitespace runs and trim: str.split() drops exactly the characters r"\s" matches,
+    # in one C pass and with no regex engine involved; empty/None short-circuits
+    return " ".join(s.split()) if s else ""
+
+# byte table: keep a-z0-9, everything else becomes a space
+TITLE_KEY_TABLE = bytes(c if c in (string.ascii_lowercase + string.digits).encode() else 32 for c in range(256))
 
+@lru_cache(maxsize=None)
 def norm_title_key(title):
-    t = normalize_text(title).lower()
-    t = re.sub(r"[^a-z0-9]+", " ", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    # Memoized on the raw title, so an exact-duplicate title (same paper from several
+    # sources, or the link + key passes of dedup) is normalized only once.
+    # Non-ASCII encodes to '?' and so turns into a space, same as the old [^a-z0-9]+ regex;
+    # split()/join then collapses and strips the spaces in C.
+    if not title:
+        return ""
+    t = title.lower().encode("ascii", "replace").translate(TITLE_KEY_TABLE)
+    return " ".join(t.decode("ascii").split())
+
+YEAR_RX = re.compile(r"(?:19|20)\d{2}")  # linear patterns: no backtracking blow-up on long WoS strings
+DOI_RX = re.compile(r"10\.\d{4,9}/\S+\b")
 
 def safe_year(text):
     if not text: return None
-    m = re.search(r"(19|20)\d{2}", str(text))
+    m = YEAR_RX.search(text if isinstance(text, str) else str(text))
     return int(m.group(0)) if m else None
 
-def norm_record(source, _id=None, title=None, authors=None, year=None, doi=None, url=None, venue=None, extra=None):
+def iter_strings(obj):
+    """Yield every key and scalar value of a nested JSON structure as a string, in document order."""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for k, v in obj.items():
+            yield k
+            yield from iter_strings(v)
+    elif isinstance(obj, list):
+        for v in obj:
+            yield from iter_strings(v)
+    elif isinstance(obj, (int, float)) and not isinstance(obj, bool):
+        yield str(obj)
+
+def sniff_doi_year(rec):
+    """First DOI-looking and year-looking substrings anywhere in a record, without serializing it."""
+    doi = year = None
+    for s in iter_strings(rec):
+        if doi is None:
+            m = DOI_RX.search(s)
+            if m: doi = m.group(0)
+        if year is None:
+            year = safe_year(s)
+        if doi is not None and year is not None:
+            break
+    return doi, year
+
+DOI_PREFIX_RX = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)", re.IGNORECASE)
+
+def norm_doi(doi):
+    # bare DOI: resolver URLs (http/https, dx.) and "doi:" prefixes all reduce to the same dedup key
+    return DOI_PREFIX_RX.sub("", (doi or "").strip())
+
+def norm_record(source, _id=None, title=None, authors=None, year=None, doi=None, url=None, venue=None, extra=None,
+                ids=None, *, _int=int, _str=str, _isinstance=isinstance, _intern=sys.intern):
+    # source/venue repeat across hundreds of records: intern them so duplicates share one
+    # string (pickle then also ships each only once back from the normalizer processes).
+    # Builtins are bound as keyword-only defaults: LOAD_FAST instead of a global lookup per record.
     return {
-        "source": source,
+        "source": _intern(source),
         "id": _id or "",
         "title": normalize_text(title) if title else "",
         "authors": authors or [],
-        "year": int(year) if isinstance(year, int) or (isinstance(year, str) and year.isdigit()) else "",
-        "doi": (doi or "").replace("https://doi.org/","").strip(),
+        "year": _int(year) if _isinstance(year, _int) or (_isinstance(year, _str) and year.isdigit()) else "",
+        "doi": norm_doi(doi),
         "url": (url or "").strip(),
-        "venue": normalize_text(venue) if venue else "",
+        "venue": _intern(normalize_text(venue)) if venue else "",
+        "ids": ids or [],  # cross-source identifiers (pmid:, arxiv:, mag:, ...) for cluster_by_ids
         "extra": extra or {},  # stash snippets, etc.
     }
 
+ARXIV_VERSION_RX = re.compile(r"v\d+$")
+
+def arxiv_key(s):
+    """Versionless lower-case arXiv id from an abs URL, a bare id or a 10.48550/arXiv.* DOI."""
+    s = str(s).strip().lower()
+    for prefix in ("arxiv.org/abs/", "10.48550/arxiv.", "arxiv:"):
+        s = s.rpartition(prefix)[2]
+    return ARXIV_VERSION_RX.sub("", s)
+
+def xref_ids(pmid=None, pmcid=None, mag=None, arxiv=None):
+    """Namespaced non-DOI identifiers of one record; PubMed/PMC values may be bare or resolver URLs."""
+    ids = []
+    if pmid:
+        ids.append("pmid:" + str(pmid).rstrip("/").rpartition("/")[2])
+    if pmcid:
+        pmcid = str(pmcid).rstrip("/").rpartition("/")[2].upper()
+        ids.append("pmcid:" + (pmcid[3:] if pmcid.startswith("PMC") else pmcid))
+    if mag:
+        ids.append(f"mag:{mag}")
+    if arxiv:
+        ids.append("arxiv:" + arxiv_key(arxiv))
+    return ids
+
 # ------------ Normalizers per source --------------
 
 def normalize_google_scholar():
     p = RAW / "google_scholar_all.json"
-    data = read_json(p)
-    if not data: return []
     recs = []
-    for it in data.get("items", []):
+    for it in iter_items(p, "items"):
         title = it.get("title")
         url = it.get("link")
         if not url and isinstance(it.get("resources"), list) and it["resources"]:
@@ -128,9 +398,10 @@ def normalize_google_scholar():
             authors = [a.get("name") for a in pub["authors"] if isinstance(a, dict) and a.get("name")]
         else:
             summary = pub.get("summary") or ""
-            first = summary.split(" - ")[0] if " - " in summary else ""
+            first = summary.partition(" - ")[0] if " - " in summary else ""
             if first:
-                authors = [x.strip() for x in first.split(",") if x.strip()][:12]
+                # stop after 12 names instead of stripping every token and slicing
+                authors = list(islice(filter(None, map(str.strip, first.split(","))), 12))
         year = pub.get("year") or safe_year(pub.get("summary") or it.get("snippet"))
         venue = None
         extra = {"snippet": it.get("snippet") or "", "pub_summary": pub.get("summary") or ""}
@@ -139,82 +410,106 @@ def normalize_google_scholar():
 
 def normalize_semantic_scholar():
     p = RAW / "semanticscholar_all.json"
-    data = read_json(p)
-    if not data: return []
-    items = data.get("items", []) or data.get("data", [])
     recs = []
-    for it in items:
-        _id = it.get("paperId") or (it.get("externalIds") or {}).get("CorpusId")
+    for it in iter_items(p, "items", "data"):
+        ext = it.get("externalIds") or {}
+        _id = it.get("paperId") or ext.get("CorpusId")
         title = it.get("title")
         authors = [a.get("name") for a in (it.get("authors") or []) if isinstance(a, dict) and a.get("name")]
         year = it.get("year")
-        doi = it.get("doi") or (it.get("externalIds") or {}).get("DOI")
+        doi = it.get("doi") or ext.get("DOI")
         url = it.get("url")
         venue = it.get("venue")
-        recs.append(norm_record("semantic_scholar", _id or doi or url or title, title, authors, year, doi, url, venue))
+        ids = xref_ids(ext.get("PubMed"), ext.get("PubMedCentral"), ext.get("MAG"), ext.get("ArXiv"))
+        recs.append(norm_record("semantic_scholar", _id or doi or url or title, title, authors, year, doi, url, venue, ids=ids))
     return recs
 
 def normalize_openalex():
     p = RAW / "openalex_all.json"
-    data = read_json(p)
-    if not data: return []
-    items = data.get("items", []) or data.get("results", [])
     recs = []
-    for it in items:
+    for it in iter_items(p, "items", "results"):
         _id = it.get("id")
         title = it.get("display_name")
         year = it.get("publication_year")
         doi = (it.get("doi") or "").replace("https://doi.org/","")
         url = ("https://doi.org/" + doi) if doi else _id
-        venue = (it.get("host_venue") or {}).get("display_name")
+        # host_venue in older dumps; current API (and select=) only has primary_location.source
+        venue = ((it.get("host_venue") or {}).get("display_name")
+                 or ((it.get("primary_location") or {}).get("source") or {}).get("display_name"))
         authors = []
         for au in (it.get("authorships") or []):
             ad = au.get("author") or {}
             if ad.get("display_name"): authors.append(ad["display_name"])
-        recs.append(norm_record("openalex", _id or doi or url or title, title, authors, year, doi, url, venue))
+        oa = it.get("ids") or {}
+        ids = xref_ids(oa.get("pmid"), oa.get("pmcid"), oa.get("mag"))
+        recs.append(norm_record("openalex", _id or doi or url or title, title, authors, year, doi, url, venue, ids=ids))
     return recs
 
 def normalize_pubmed():
     # We stored PMIDs only (from ESearch). Titles/DOIs require EFetch (optional future step).
     p = RAW / "pubmed_esearch_all.json"
-    data = read_json(p)
-    if not data: return []
     recs = []
-    for pmid in data.get("pmids", []):
-        recs.append(norm_record("pubmed", f"PMID:{pmid}", None, None, None, None, f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/", None))
+    for pmid in iter_items(p, "pmids"):
+        recs.append(norm_record("pubmed", f"PMID:{pmid}", None, None, None, None, f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/", None,
+                                ids=xref_ids(pmid)))
     return recs
 
+ATOM_ENTRY = "{http://www.w3.org/2005/Atom}entry"
+
+def iter_atom_entries(xml_bytes):
+    """
+    Stream the <entry> elements of an Atom feed with iterparse. Each entry is
+    cleared once the caller moves on (under lxml its processed siblings are
+    dropped too), so a feed page never sits in memory as a full tree.
+    """
+    tag_filter = {"tag": ATOM_ENTRY} if LXML else {}
+    for _, e in ET.iterparse(BytesIO(xml_bytes), events=("end",), **tag_filter):
+        if e.tag != ATOM_ENTRY:
+            continue
+        yield e
+        e.clear()
+        if LXML:
+            while e.getprevious() is not None:
+                del e.getparent()[0]
+
 def normalize_arxiv():
     p = RAW / "arxiv_all.json"
-    data = read_json(p)
-    if not data: return []
     ns = {"atom":"http://www.w3.org/2005/Atom", "arxiv":"http://arxiv.org/schemas/atom"}
     recs = []
-    for page in data.get("pages", []):
+    for page in iter_items(p, "pages"):
+        if "entries" in page:
+            # current paper_search.py dumps: entries already parsed from the Atom stream
+            for it in page["entries"] or []:
+                _id = it.get("id") or ""
+                title = (it.get("title") or "").replace("\n", " ")
+                doi = it.get("doi")
+                recs.append(norm_record("arxiv", _id or doi or title, title, it.get("authors"),
+                                        safe_year(it.get("published")), doi, _id, "arXiv", ids=xref_ids(arxiv=_id)))
+            continue
+        page_recs = []
         try:
-            root = ET.fromstring(page.get("xml",""))
+            # bytes: lxml rejects str with an encoding declaration
+            for e in iter_atom_entries(page.get("xml","").encode("utf-8")):
+                _id = (e.findtext("atom:id", default="", namespaces=ns) or "").strip()
+                title = (e.findtext("atom:title", default="", namespaces=ns) or "").strip().replace("\n"," ")
+                authors = [a.findtext("atom:name", default="", namespaces=ns) for a in e.findall("atom:author", ns)]
+                published = e.findtext("atom:published", default="", namespaces=ns) or ""
+                year = safe_year(published)
+                doi = None
+                for d in e.findall("arxiv:doi", ns):
+                    if d.text: doi = d.text.strip()
+                url = _id
+                page_recs.append(norm_record("arxiv", _id or doi or title, title, authors, year, doi, url, "arXiv",
+                                             ids=xref_ids(arxiv=_id)))
         except Exception:
-            continue
-        for e in root.findall("atom:entry", ns):
-            _id = (e.findtext("atom:id", default="", namespaces=ns) or "").strip()
-            title = (e.findtext("atom:title", default="", namespaces=ns) or "").strip().replace("\n"," ")
-            authors = [a.findtext("atom:name", default="", namespaces=ns) for a in e.findall("atom:author", ns)]
-            published = e.findtext("atom:published", default="", namespaces=ns) or ""
-            year = safe_year(published)
-            doi = None
-            for d in e.findall("arxiv:doi", ns):
-                if d.text: doi = d.text.strip()
-            url = _id
-            recs.append(norm_record("arxiv", _id or doi or title, title, authors, year, doi, url, "arXiv"))
+            continue  # malformed page is skipped whole, as with the old fromstring
+        recs += page_recs
     return recs
 
 def normalize_scopus():
     p = RAW / "scopus_all.json"
-    data = read_json(p)
-    if not data: return []
-    entries = data.get("entries") or (data.get("search-results", {}) or {}).get("entry") or []
     recs = []
-    for it in entries:
+    for it in iter_items(p, "entries", "search-results.entry"):
         title = it.get("dc:title") or it.get("title")
         doi = it.get("prism:doi")
         url = it.get("prism:url")
@@ -231,43 +526,62 @@ def normalize_scopus():
                     nm = a.get("authname") or a.get("given-name") or a.get("surname")
                     if nm: authors.append(nm)
         _id = it.get("dc:identifier") or doi or url or title
-        recs.append(norm_record("scopus", _id, title, authors, year, doi, url, venue))
+        ids = xref_ids(it.get("pubmed-id"))
+        recs.append(norm_record("scopus", _id, title, authors, year, doi, url, venue, ids=ids))
     return recs
 
 def normalize_wos():
     p = RAW / "wos_all.json"
-    data = read_json(p)
-    if not data: return []
     recs = []
-    for page in data.get("pages", []):
-        payload = page.get("payload") or {}
-        records = (payload.get("Data") or {}).get("Records")
-        if not isinstance(records, list): continue
-        for r in records:
-            _id = r.get("UID") or r.get("uid") or ""
-            # Title can be in list/dict under "Title"
-            title = ""
-            tt = r.get("Title")
-            if isinstance(tt, list) and tt:
-                title = tt[0].get("Title") or ""
-            elif isinstance(tt, dict):
-                title = tt.get("Title") or ""
-            # DOI (best-effort sniff anywhere in record)
-            doi = None
-            rec_str = json.dumps(r, ensure_ascii=False)
-            m = re.search(r"10\.\d{4,9}/\S+\b", rec_str)
-            if m: doi = m.group(0)
-            year = safe_year(rec_str)
-            url = f"https://www.webofscience.com/wos/woscc/full-record/{_id}" if _id else ""
-            recs.append(norm_record("web_of_science", _id or doi or title, title, [], year, doi, url, ""))
+    # one WoS record at a time, straight out of every page's payload
+    for r in iter_items(p, "pages.item.payload.Data.Records"):
+        if not isinstance(r, dict): continue
+        _id = r.get("UID") or r.get("uid") or ""
+        # Title can be in list/dict under "Title"
+        title = ""
+        tt = r.get("Title")
+        if isinstance(tt, list) and tt:
+            title = tt[0].get("Title") or ""
+        elif isinstance(tt, dict):
+            title = tt.get("Title") or ""
+        # DOI / year (best-effort sniff anywhere in record)
+        doi, year = sniff_doi_year(r)
+        url = f"https://www.webofscience.com/wos/woscc/full-record/{_id}" if _id else ""
+        recs.append(norm_record("web_of_science", _id or doi or title, title, [], year, doi, url, ""))
     return recs
 
+NORMALIZERS = [
+    normalize_google_scholar,
+    normalize_semantic_scholar,
+    normalize_openalex,
+    normalize_arxiv,
+    normalize_scopus,
+    normalize_wos,
+    normalize_pubmed,  # PMIDs only (URLs)
+]
+
+def normalize_all_sources(workers=None):
+    """
+    Run every per-source normalizer in its own process: they read independent
+    files and the JSON/XML parsing is CPU-bound, so wall time is roughly the
+    slowest source instead of the sum. Records come back in NORMALIZERS order.
+    """
+    # the fork start method spawns every worker up front, so never size the pool past the source count
+    workers = workers or min(len(NORMALIZERS), os.cpu_count() or 1)
+    records = []
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for fut in [ex.submit(fn) for fn in NORMALIZERS]:
+            records += fut.result()
+    return records
+
 # ------------- Deduplication ---------------------
 
 SOURCE_PRIORITY = [
     # Prefer richer/bibliographic sources when DOI/title tie
     "web_of_science", "scopus", "openalex", "semantic_scholar", "google_scholar", "arxiv", "pubmed"
 ]
+SOURCE_RANK = {s: i for i, s in enumerate(SOURCE_PRIORITY)}
+UNKNOWN_RANK = len(SOURCE_PRIORITY)  # unknown sources sort last instead of raising
 
 def better_record(a, b):
     """Choose a 'better' record between a and b when keys collide."""
@@ -275,51 +589,255 @@ def better_record(a, b):
     if (a.get("doi") and not b.get("doi")): return a
     if (b.get("doi") and not a.get("doi")): return b
     # Prefer longer title (heuristic for completeness)
-    if len(a.get("title","")) > len(b.get("title","")): return a
-    if len(b.get("title","")) > len(a.get("title","")): return b
-    # Prefer source priority
-    if SOURCE_PRIORITY.index(a["source"]) < SOURCE_PRIORITY.index(b["source"]): return a
+    la, lb = len(a.get("title","")), len(b.get("title",""))
+    if la != lb: return a if la > lb else b
+    # Prefer source priority (O(1) dict lookup, not SOURCE_PRIORITY.index)
+    if SOURCE_RANK.get(b.get("source"), UNKNOWN_RANK) < SOURCE_RANK.get(a.get("source"), UNKNOWN_RANK): return b
     return a  # default
 
-def deduplicate(records):
-    by_doi, by_title = {}, {}
-    kept = []
+def record_ids(r):
+    """Every identifier of a record: its DOI (an arXiv DOI also yields the arXiv id) plus its xref ids."""
+    ids = set(r.get("ids") or ())
+    doi = (r.get("doi") or "").lower()
+    if doi:
+        ids.add(f"doi:{doi}")
+        if doi.startswith("10.48550/arxiv."):
+            ids.add("arxiv:" + arxiv_key(doi))
+    return ids
+
+def cluster_by_ids(records):
+    """
+    Union-find over shared identifiers (DOI, PMID, PMCID, MAG, arXiv id):
+    records carrying any identifier in common share a cluster however many
+    sources indexed them, e.g. a bare PubMed PMID joins the OpenAlex record
+    listing that PMID. Returns member lists in first-seen order; records
+    with no identifier are clusters of one.
+    """
+    parent = list(range(len(records)))
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # path halving
+            i = parent[i]
+        return i
+    owner = {}
+    for i, r in enumerate(records):
+        for key in record_ids(r):
+            a, b = find(owner.setdefault(key, i)), find(i)
+            if a != b:
+                parent[max(a, b)] = min(a, b)  # the root is always the cluster's first record
+    clusters = {}
+    for i, r in enumerate(records):
+        clusters.setdefault(find(i), []).append(r)
+    return list(clusters.values())
+
+def canonical_record(members):
+    """The cluster's representative, picked pairwise by better_record (DOI, fuller title, source priority)."""
+    best = members[0]
+    for r in members[1:]:
+        best = better_record(best, r)
+    return best
+
+def write_clusters(path: Path, clusters):
+    """clusters.json: [{cluster_id, ids, canonical, members: [{source, id}]}], one entry per identifier cluster."""
+    out = []
+    for n, members in enumerate(clusters):
+        canonical = {k: v for k, v in canonical_record(members).items() if k != "extra"}
+        out.append({
+            "cluster_id": n,
+            "ids": sorted(set().union(*map(record_ids, members))),
+            "canonical": canonical,
+            "members": [{"source": m["source"], "id": m["id"]} for m in members],
+        })
+    with path.open("wb") as f:
+        f.write(json_dumps(out))
+
+def title_key(r):
+    """Normalized title (+year) key, or None for an unusable title."""
+    key = norm_title_key(r.get("title",""))
+    if not key:
+        return None
+    return f"t:{key}|{r['year']}" if r.get("year") else f"t:{key}"
+
+def link_titles_to_dois(records):
+    """Title key -> DOI key for records that have both, so DOI-less copies merge into the DOI record."""
+    links = {}
     for r in records:
         doi = (r.get("doi") or "").lower()
         if doi:
-            if doi in by_doi:
-                best = better_record(by_doi[doi], r)
-                by_doi[doi] = best
-            else:
-                by_doi[doi] = r
-            continue
-        # no DOI → fallback to normalized title key (+year if present)
-        key = norm_title_key(r.get("title",""))
-        if not key:
-            kept.append(r)
+            tkey = title_key(r)
+            if tkey:
+                links.setdefault(tkey, f"doi:{doi}")
+    return links
+
+def dedup_key(r, title_to_doi=None):
+    """DOI when present, else the linked DOI or normalized title (+year); None if neither is usable."""
+    doi = (r.get("doi") or "").lower()
+    if doi:
+        return f"doi:{doi}"
+    tkey = title_key(r)
+    if tkey and title_to_doi:
+        return title_to_doi.get(tkey, tkey)
+    return tkey
+
+def deduplicate(records):
+    """
+    Identifier clusters fold to their canonical record first, then one dict
+    keyed by dedup_key (titles linked to DOIs first); records without a key are all kept.
+    """
+    records = [canonical_record(m) for m in cluster_by_ids(list(records))]
+    links = link_titles_to_dois(records)
+    kept = {}
+    for i, r in enumerate(records):
+        key = dedup_key(r, links) or i
+        kept[key] = better_record(kept[key], r) if key in kept else r
+    return collapse_near_duplicates(kept.values())
+
+# Near-duplicate collapse: MinHash-LSH over title character 3-grams
+MINHASH_PERM = 64
+MINHASH_BANDS = 16  # 16 bands x 4 rows: pairs at Jaccard 0.85 collide with ~1 - 1e-5 probability
+MINHASH_PRIME = (1 << 61) - 1
+MINHASH_PARAMS = [(rng.randrange(1, MINHASH_PRIME), rng.randrange(MINHASH_PRIME))
+                  for rng in [random.Random(1)] for _ in range(MINHASH_PERM)]
+
+def title_shingles(r, k=3):
+    key = norm_title_key(r.get("title",""))
+    return {key[i:i+k] for i in range(len(key) - k + 1)}
+
+def minhash_bands(shingles):
+    hashes = [zlib.crc32(s.encode()) for s in shingles]
+    sig = [min((a * h + b) % MINHASH_PRIME for h in hashes) for a, b in MINHASH_PARAMS]
+    rows = MINHASH_PERM // MINHASH_BANDS
+    return [(i, tuple(sig[i*rows:(i+1)*rows])) for i in range(MINHASH_BANDS)]
+
+def collapse_near_duplicates(records, threshold=None):
+    """
+    Fold records whose titles are near-identical (subtitle/punctuation variants,
+    preprint vs. published wording) that exact title keys miss. LSH bands only
+    propose candidates; a pair is merged via better_record when the true 3-gram
+    Jaccard is >= threshold and the two do not carry different DOIs or years.
+    Records without a usable title pass through untouched. Order is kept.
+    """
+    threshold = NEAR_DUP_THRESHOLD if threshold is None else threshold
+    if not threshold: return list(records)
+    kept, shingles, buckets = [], [], {}
+    for r in records:
+        sh = title_shingles(r)
+        if not sh:
+            kept.append(r); shingles.append(None)
             continue
-        if r.get("year"):
-            key = f"{key}|{r['year']}"
-        if key in by_title:
-            best = better_record(by_title[key], r)
-            by_title[key] = best
+        bands = minhash_bands(sh)
+        cands = sorted({c for band in bands for c in buckets.get(band, ())})
+        for c in cands:
+            other = kept[c]
+            doi_a, doi_b = (other.get("doi") or "").lower(), (r.get("doi") or "").lower()
+            if doi_a and doi_b and doi_a != doi_b: continue
+            # same title in different years (recurring proceedings, "Abstracts" volumes) stays apart, as in title_key
+            year_a, year_b = str(other.get("year") or ""), str(r.get("year") or "")
+            if year_a and year_b and year_a != year_b: continue
+            if len(sh & shingles[c]) / len(sh | shingles[c]) >= threshold:
+                kept[c] = better_record(other, r)
+                break
         else:
-            by_title[key] = r
-    # merge
-    kept.extend(by_doi.values())
-    kept.extend(by_title.values())
+            for band in bands:
+                buckets.setdefault(band, []).append(len(kept))
+            kept.append(r); shingles.append(sh)
     return kept
 
 # ------------- Filtering (MV + Weaning [+ RL]) -------------
 
-def compile_terms(terms):
-    flags = 0 if CASE_SENSITIVE else re.IGNORECASE
-    return [re.compile(t if t.startswith(r"\b") or "[" in t or "*" in t or " " in t else re.escape(t), flags) for t in terms]
+ESCAPE_RX = re.compile(r"\\.|[^\\]+")
+
+def lower_term(t):
+    # lowercase a term but leave escapes (\b, \S, ...) alone
+    return ESCAPE_RX.sub(lambda m: m.group(0) if m.group(0).startswith("\\") else m.group(0).lower(), t)
+
+def compile_terms(terms, flags=None):
+    """
+    Fold a term list into ONE alternation pattern, so each blob is scanned once
+    per category instead of once per term. Raw regex terms (\b..., special chars,
+    phrases) are kept as-is; plain words are escaped.
+    With the default flags and CASE_SENSITIVE off, terms are lowercased here and
+    the pattern is case-sensitive: callers search a blob they lowercased once.
+    """
+    if flags is None:
+        flags = 0
+        if not CASE_SENSITIVE:
+            terms = [lower_term(t) for t in terms]
+    alts = []
+    for t in terms:
+        if t.startswith(r"\b") or any(ch in t for ch in r"[]()|?*+{}") or " " in t:
+            alts.append(t)
+        else:
+            alts.append(re.escape(t))
+    return compile_rx("(?:" + "|".join(alts) + ")", flags)
+
+def compile_rx(pattern, flags=0):
+    # google-re2 when installed; anything it rejects (lookarounds, backrefs, other flags) stays on `re`
+    if re2 is not None and flags in (0, re.IGNORECASE):
+        try:
+            return re2.compile(("(?i)" if flags else "") + pattern)  # re2 takes Options, not re flags
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
 
 RL_RX = compile_terms(RL_TERMS)
 MV_RX = compile_terms(MV_TERMS)
 WEAN_RX = compile_terms(WEAN_TERMS)
 
+def is_literal_term(t):
+    return not (t.startswith(r"\b") or any(ch in t for ch in "\\[]()|?*+{}."))
+
+def split_terms(categories):
+    """
+    Partition each category's terms into plain literals (lowercased unless
+    CASE_SENSITIVE) and a small residual pattern for the ones that need real
+    regex (\b anchors, optional chars). Returns (literals, residual) dicts.
+    """
+    literals, residual = {}, {}
+    for cat, terms in categories.items():
+        lits = [t for t in terms if is_literal_term(t)]
+        rest = [t for t in terms if not is_literal_term(t)]
+        literals[cat] = tuple(t if CASE_SENSITIVE else t.lower() for t in lits)
+        residual[cat] = compile_terms(rest) if rest else None
+    return literals, residual
+
+def build_keyword_automaton(literals):
+    """
+    One Aho-Corasick automaton over the literal terms of every category, so a
+    blob is scanned once for all ~23 keywords. Returns None when pyahocorasick
+    is not installed (keyword_hits then falls back to substring tests).
+    """
+    if ahocorasick is None:
+        return None
+    owners = {}
+    for cat, words in literals.items():
+        for word in words:
+            owners.setdefault(word, set()).add(cat)
+    automaton = ahocorasick.Automaton()
+    for word, cats in owners.items():
+        automaton.add_word(word, tuple(cats))
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_LITERALS, RESIDUAL_RX = split_terms({"mv": MV_TERMS, "wean": WEAN_TERMS, "rl": RL_TERMS})
+KEYWORD_AUTOMATON = build_keyword_automaton(KEYWORD_LITERALS)
+
+def keyword_hits(blob):
+    """Set of categories ('mv', 'wean', 'rl') with at least one keyword in blob."""
+    if not CASE_SENSITIVE:
+        blob = blob.lower()  # once per record; every pattern below is compiled lowercase
+    if KEYWORD_AUTOMATON is None:
+        # plain `in` is a C-level substring search, no regex machinery per literal
+        hits = {cat for cat, words in KEYWORD_LITERALS.items() if any(w in blob for w in words)}
+    else:
+        hits = set()
+        for _, cats in KEYWORD_AUTOMATON.iter(blob):
+            hits.update(cats)
+    for cat, rx in RESIDUAL_RX.items():
+        if cat not in hits and rx is not None and rx.search(blob):
+            hits.add(cat)
+    return hits
+
 def text_blob(rec):
     parts = [rec.get("title",""), rec.get("venue","")]
     extra = rec.get("extra") or {}
@@ -328,55 +846,79 @@ def text_blob(rec):
     parts.append(extra.get("pub_summary",""))
     return " ".join([p for p in parts if p])
 
-def matches_any(rx_list, text):
-    return any(r.search(text) for r in rx_list)
+def matches_any(rx, text):
+    return rx.search(text) is not None
+
+def screen_record(r, hits):
+    """Annotate r from its keyword hits; True if it passes the MV+Weaning (+RL) screen."""
+    has_mv = "mv" in hits
+    has_wean = "wean" in hits
+    has_rl = "rl" in hits
+
+    if has_mv and has_wean and (has_rl or not STRICT_REQUIRE_RL):
+        r["match_mv"] = has_mv
+        r["match_weaning"] = has_wean
+        r["match_rl"] = has_rl
+        return True
+    reason = []
+    if not has_mv:
+        reason.append("no_mv")
+    if not has_wean:
+        reason.append("no_weaning")
+    if STRICT_REQUIRE_RL and not has_rl:
+        reason.append("no_rl")
+    r["auto_exclude_reason"] = ",".join(reason) if reason else "no_match"
+    return False
 
 def apply_filters(records):
     screened_in = []
     screened_out = []
     for r in records:
-        blob = text_blob(r)
-        has_mv = matches_any(MV_RX, blob)
-        has_wean = matches_any(WEAN_RX, blob)
-        has_rl = matches_any(RL_RX, blob)
-
-        if has_mv and has_wean and (has_rl or not STRICT_REQUIRE_RL):
-            r["match_mv"] = has_mv
-            r["match_weaning"] = has_wean
-            r["match_rl"] = has_rl
+        if screen_record(r, keyword_hits(text_blob(r))):
             screened_in.append(r)
         else:
-            reason = []
-            if not has_mv:
-                reason.append("no_mv")
-            if not has_wean:
-                reason.append("no_weaning")
-            if STRICT_REQUIRE_RL and not has_rl:
-                reason.append("no_rl")
-            r["auto_exclude_reason"] = ",".join(reason) if reason else "no_match"
             screened_out.append(r)
-
     return screened_in, screened_out
 
-# ------------------ Abstract fetching (Stage 2) ------------------
+def dedup_and_screen(records, clusters=None):
+    """
+    deduplicate + apply_filters fused into one pass over the raw records.
+    A record's blob is scored only when it wins its dedup key, so losing
+    duplicates are never scanned and no intermediate list is rebuilt.
+    `clusters` is cluster_by_ids(records) when the caller already has it.
+    Returns (dedup, screened_in, screened_out), all in dedup order.
+    """
+    if clusters is None:
+        clusters = cluster_by_ids(list(records))
+    records = [canonical_record(m) for m in clusters]
+    links = link_titles_to_dois(records)
+    kept, hits = {}, {}
+    for i, r in enumerate(records):
+        key = dedup_key(r, links) or i
+        cur = kept.get(key)
+        best = r if cur is None else better_record(cur, r)
+        if best is not cur:
+            kept[key] = best
+            hits[key] = keyword_hits(text_blob(best))
+    # better_record returns one of its inputs, so each survivor's hits are already known
+    hits = {id(kept[key]): h for key, h in hits.items()}
+    dedup = collapse_near_duplicates(kept.values())
+    screened_in, screened_out = [], []
+    for r in dedup:
+        (screened_in if screen_record(r, hits[id(r)]) else screened_out).append(r)
+    return dedup, screened_in, screened_out
 
-def abs_compile_terms(terms):
-    # abstracts are case-insensitive checks
-    rx = []
-    for t in terms:
-        if any(ch in t for ch in r"\[]()|?*+{}") or " " in t:
-            rx.append(re.compile(t, re.IGNORECASE))
-        else:
-            rx.append(re.compile(re.escape(t), re.IGNORECASE))
-    return rx
+# ------------------ Abstract fetching (Stage 2) ------------------
 
-ABS_RL_RX   = abs_compile_terms(RL_TERMS)
-ABS_MV_RX   = abs_compile_terms(MV_TERMS)
-ABS_WEAN_RX = abs_compile_terms(WEAN_TERMS)  # computed but not used for decision
+# abstracts are case-insensitive checks
+ABS_RL_RX   = compile_terms(RL_TERMS,   re.IGNORECASE)
+ABS_MV_RX   = compile_terms(MV_TERMS,   re.IGNORECASE)
+ABS_WEAN_RX = compile_terms(WEAN_TERMS, re.IGNORECASE)  # computed but not used for decision
+ABS_CATEGORY_RX = {"mv": ABS_MV_RX, "wean": ABS_WEAN_RX, "rl": ABS_RL_RX}
 
-def abs_matches_any(rx_list, text):
+def abs_matches_any(rx, text):
     if not text: return False
-    return any(r.search(text) for r in rx_list)
+    return rx.search(text) is not None
 
 def load_csv_rows(path: Path):
     rows = []
@@ -389,274 +931,523 @@ def load_csv_rows(path: Path):
             rows.append(row)
     return rows
 
+class RateLimiter:
+    """
+    Thread-safe per-host limiter: at most `rate` requests per `period` seconds.
+    All workers hitting the same host share one instance, so the budget holds
+    however many threads are running, and no time is wasted sleeping when the
+    previous request was already slow.
+    """
+    def __init__(self, rate, period=1.0):
+        self.interval = period / rate
+        self.next_at = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_at)
+            self.next_at = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def hold(self, seconds):
+        """Server asked us to back off: no worker on this host starts a request for `seconds`."""
+        with self.lock:
+            self.next_at = max(self.next_at, time.monotonic() + seconds)
+
+# optional API keys (same variable names as paper_search.py) raise the per-host ceilings
+NCBI_API_KEY = os.getenv("NCBI_API_KEY")
+S2_API_KEY = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+OPENALEX_MAILTO = os.getenv("OPENALEX_MAILTO")  # contact address: puts abstract batches in the polite pool
+
+PUBMED_LIMIT   = RateLimiter(10 if NCBI_API_KEY else 3, 1.0)  # NCBI E-utilities: 10/s with a key, 3/s without
+S2_LIMIT       = RateLimiter(1, 1.0)   # Semantic Scholar public tier (and the default keyed tier)
+OPENALEX_LIMIT = RateLimiter(10, 1.0)  # OpenAlex polite pool
+ARXIV_LIMIT    = RateLimiter(1, 3.0)   # arXiv API terms: one request every 3s
+
+def make_session(pool_maxsize=16):
+    """
+    One pooled Session for every API call so TCP+TLS connections are reused
+    across batches and threads. urllib3 only retries connect/read failures here;
+    429/5xx are handled by request_with_retry so the RateLimiter stays in charge.
+    allowed_methods=None lets read retries cover the S2 batch POST, which is a lookup.
+    """
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_maxsize,
+                          max_retries=Retry(total=None, connect=3, read=3, status=0, backoff_factor=0.5,
+                                            allowed_methods=None))
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+SESSION = make_session()
+
+def request_with_retry(method, url, limiter, max_retries=5, base_sleep=1.0, **kwargs):
+    """
+    SESSION.request wrapped with the host's RateLimiter, retrying 429/5xx with
+    exponential backoff (or Retry-After when the server sends it). The backoff
+    is a hold on the limiter, so every worker on that host pauses, not just this
+    one; a response reporting X-RateLimit-Remaining: 0 holds it the same way.
+    The last response is returned as-is; callers still call raise_for_status().
+    """
+    for attempt in range(max_retries):
+        limiter.wait()
+        r = SESSION.request(method, url, **kwargs)
+        try:
+            retry_after = float(r.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            retry_after = None
+        if r.status_code != 429 and r.status_code < 500:
+            if r.headers.get("X-RateLimit-Remaining") == "0":
+                limiter.hold(retry_after or base_sleep)
+            return r
+        limiter.hold(retry_after if retry_after is not None else base_sleep * 2 ** attempt)
+    return r
+
+class AbstractCache:
+    """
+    Persistent (namespace, id) -> JSON value store backed by SQLite.
+    Abstracts are effectively immutable, so anything fetched once is served
+    from disk on the next run and only new identifiers hit the APIs.
+    Entries older than `ttl` seconds are treated as missing. Ids an API answered
+    without an abstract are remembered for the shorter `miss_ttl`, so reruns do
+    not re-ask for them every time but still pick up late-indexed abstracts.
+    """
+    def __init__(self, path: Path, ttl=30 * 24 * 3600, miss_ttl=7 * 24 * 3600):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(str(path), check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, stored_at REAL)")
+        self.db.commit()
+
+    def get_many(self, namespace, ids, ttl=None):
+        out = {}
+        fresh_after = time.time() - (self.ttl if ttl is None else ttl)
+        with self.lock:
+            for _id in ids:
+                row = self.db.execute("SELECT value, stored_at FROM cache WHERE key = ?",
+                                      (f"{namespace}:{_id}",)).fetchone()
+                if row and row[1] >= fresh_after:
+                    out[_id] = json_loads(row[0])
+        return out
+
+    def set_many(self, namespace, items):
+        if not items: return
+        now = time.time()
+        with self.lock:
+            self.db.executemany("INSERT OR REPLACE INTO cache (key, value, stored_at) VALUES (?, ?, ?)",
+                                [(f"{namespace}:{k}", json_dumps(v), now) for k, v in items.items()])
+            self.db.commit()
+
+    def get_misses(self, namespace, ids):
+        return set(self.get_many(namespace + ":miss", ids, ttl=self.miss_ttl))
+
+    def set_misses(self, namespace, ids):
+        self.set_many(namespace + ":miss", dict.fromkeys(ids, True))
+
+CACHE = AbstractCache(ABSTRACT_CACHE, ttl=0, miss_ttl=0) if REFRESH_ABSTRACTS else AbstractCache(ABSTRACT_CACHE)
+
+def map_batches(fetch_batch, batches, workers=1):
+    """
+    Run fetch_batch over batches on a small thread pool (I/O-bound HTTP calls).
+    Pacing is left to the per-host RateLimiter. Results come back in batch order.
+    """
+    if workers <= 1 or len(batches) <= 1:
+        return [fetch_batch(b) for b in batches]
+    with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as pool:
+        return list(pool.map(fetch_batch, batches))
+
+def parse_pubmed_abstracts(xml_bytes):
+    """
+    EFetch XML -> {pmid: abstract}. Streams <PubmedArticle> elements with
+    iterparse and clears each one once read, so memory stays flat whatever
+    the batch size.
+    """
+    found = {}
+    tag_filter = {"tag": "PubmedArticle"} if LXML else {}
+    for _, article in ET.iterparse(BytesIO(xml_bytes), events=("end",), **tag_filter):
+        if article.tag != "PubmedArticle":
+            continue
+        pmid = article.findtext(".//PMID")
+        abstract_texts = []
+        for ab in article.findall(".//Abstract/AbstractText"):
+            part = (ab.text or "").strip()
+            label = ab.get("Label")
+            if label: part = f"{label}: {part}"
+            if part: abstract_texts.append(part)
+        abstract = "\n".join(abstract_texts).strip()
+        if pmid and abstract:
+            found[pmid] = abstract
+        article.clear()
+    return found
+
 # PubMed EFetch: PMID -> abstract
-def fetch_pubmed_abstracts(pmids, chunk=200, sleep=0.34):
-    out = {}
-    if not pmids: return out
+def fetch_pubmed_abstracts(pmids, chunk=200, workers=3):
+    if not pmids: return {}
+    out = CACHE.get_many("pmid", pmids)
+    pmids = [p for p in pmids if p not in out]
+    known_missing = CACHE.get_misses("pmid", pmids)
+    pmids = [p for p in pmids if p not in known_missing]
     url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-    for i in range(0, len(pmids), chunk):
-        batch = pmids[i:i+chunk]
+    def fetch_batch(batch):
+        found = {}
         try:
-            r = requests.get(url, params={"db":"pubmed","id":",".join(batch),"retmode":"xml"}, timeout=30)
+            r = request_with_retry("GET", url, PUBMED_LIMIT,
+                                   params={"db":"pubmed","id":",".join(batch),"retmode":"xml",
+                                           **({"api_key": NCBI_API_KEY} if NCBI_API_KEY else {})}, timeout=30)
             r.raise_for_status()
-            root = ET.fromstring(r.text)
-            for article in root.findall(".//PubmedArticle"):
-                pmid = article.findtext(".//PMID")
-                abstract_texts = []
-                for ab in article.findall(".//Abstract/AbstractText"):
-                    part = (ab.text or "").strip()
-                    label = ab.get("Label")
-                    if label: part = f"{label}: {part}"
-                    if part: abstract_texts.append(part)
-                abstract = "\n".join(abstract_texts).strip()
-                if pmid and abstract:
-                    out[pmid] = abstract
+            found = parse_pubmed_abstracts(r.content)
+            CACHE.set_misses("pmid", [p for p in batch if p not in found])
         except Exception:
             pass
-        time.sleep(sleep)
+        CACHE.set_many("pmid", found)
+        return found
+    batches = [pmids[i:i+chunk] for i in range(0, len(pmids), chunk)]
+    for found in map_batches(fetch_batch, batches, workers):
+        out.update(found)
     return out
 
-# Semantic Scholar batch: DOI/PMID -> abstract
-def s2_batch_by_ids(ids, fields="title,abstract,year,authors,venue,url", chunk=100, sleep=0.5):
+# Semantic Scholar batch: DOI/PMID/paperId -> abstract
+def s2_batch_by_ids(ids, fields="abstract", chunk=500, workers=1):
+    # only what Stage 2 reads. Results are keyed by the id that was sent (DOI:x, PMID:p
+    # or a bare paperId), not by ids read back from the response: S2 may know a DOI or
+    # PMID the row does not, and abstract_keys looks each row up by its own ids.
     out = {}
     if not ids: return out
+    out.update(CACHE.get_many(f"s2:{fields}", ids))
+    known_missing = CACHE.get_misses(f"s2:{fields}", ids)
+    ids = [i for i in ids if i not in out and i not in known_missing]
     url = f"https://api.semanticscholar.org/graph/v1/paper/batch?fields={fields}"
-    headers = {"Content-Type":"application/json"}
-    for i in range(0, len(ids), chunk):
-        batch = ids[i:i+chunk]
+    headers = {"Content-Type":"application/json", **({"x-api-key": S2_API_KEY} if S2_API_KEY else {})}
+    def fetch_batch(batch):
+        found = {}
         body = {"ids": batch}
         try:
-            r = requests.post(url, headers=headers, data=json.dumps(body), timeout=45)
+            r = request_with_retry("POST", url, S2_LIMIT, headers=headers, data=json_dumps(body), timeout=45)
             r.raise_for_status()
-            arr = r.json()
-            for obj in arr:
-                doi  = (obj.get("externalIds") or {}).get("DOI")
-                pmid = (obj.get("externalIds") or {}).get("PMID")
-                key = None
-                if doi: key = f"DOI:{doi}"
-                elif pmid: key = f"PMID:{pmid}"
-                elif obj.get("paperId"): key = f"S2:{obj['paperId']}"
-                elif obj.get("url"): key = obj["url"]
-                if key: out[key] = obj
+            arr = json_loads(r.content)
+            # results come back in request order, with null for unknown ids
+            for req_id, obj in zip(batch, arr):
+                if obj: found[req_id] = obj
+            # no abstract yet: cache as a miss (miss_ttl) so a later run asks again
+            CACHE.set_misses(f"s2:{fields}", [i for i in batch if not (found.get(i) or {}).get("abstract")])
         except Exception:
             pass
-        time.sleep(sleep)
+        CACHE.set_many(f"s2:{fields}", {i: obj for i, obj in found.items() if obj.get("abstract")})
+        return found
+    batches = [ids[i:i+chunk] for i in range(0, len(ids), chunk)]
+    for found in map_batches(fetch_batch, batches, workers):
+        out.update(found)
     return out
 
 # OpenAlex per-id abstract reconstruction
 def reconstruct_openalex_abstract(abstract_inv_idx):
     if not isinstance(abstract_inv_idx, dict):
         return ""
-    maxpos = -1
-    for positions in abstract_inv_idx.values():
-        if positions:
-            maxpos = max(maxpos, max(positions))
-    words = [""] * (maxpos + 1 if maxpos >= 0 else 0)
-    for word, positions in abstract_inv_idx.items():
-        for pos in positions:
-            if 0 <= pos < len(words):
-                words[pos] = word
-    return " ".join([w for w in words if w]).strip()
-
-def fetch_openalex_abstract(openalex_id):
-    if not openalex_id: return ""
-    wid = openalex_id.split("/")[-1]
-    url = f"https://api.openalex.org/works/{wid}"
-    try:
-        r = requests.get(url, params={"select":"id,doi,abstract_inverted_index"}, timeout=20)
-        r.raise_for_status()
-        data = r.json()
-        return reconstruct_openalex_abstract(data.get("abstract_inverted_index"))
-    except Exception:
-        return ""
+    # one pass to invert word -> positions (a later word wins a shared position),
+    # then join in position order; no max() scan or sparse list of blanks
+    at = {pos: word for word, positions in abstract_inv_idx.items() for pos in (positions or ())}
+    return " ".join(at[p] for p in sorted(at) if p >= 0 and at[p]).strip()
+
+def fetch_openalex_abstracts(openalex_ids, chunk=50, workers=2):
+    """
+    OpenAlex work id/URL list -> {W-id: abstract}.
+    Uses the list endpoint with filter=openalex_id:W1|W2|... (up to 50 ids per call)
+    instead of one GET per work.
+    """
+    if not openalex_ids: return {}
+    wids = list(dict.fromkeys(x.split("/")[-1] for x in openalex_ids if x))
+    out = CACHE.get_many("openalex", wids)
+    known_missing = CACHE.get_misses("openalex", wids)
+    wids = [w for w in wids if w not in out and w not in known_missing]
+    url = "https://api.openalex.org/works"
+    def fetch_batch(batch):
+        found = {}
+        params = {
+            "filter": "openalex_id:" + "|".join(batch),
+            "select": "id,doi,abstract_inverted_index",
+            "per-page": len(batch),
+        }
+        if OPENALEX_MAILTO:
+            params["mailto"] = OPENALEX_MAILTO
+        try:
+            r = request_with_retry("GET", url, OPENALEX_LIMIT, params=params, timeout=30)
+            r.raise_for_status()
+            for it in json_loads(r.content).get("results") or []:
+                a = reconstruct_openalex_abstract(it.get("abstract_inverted_index"))
+                if it.get("id") and a:
+                    found[it["id"].split("/")[-1]] = a
+            CACHE.set_misses("openalex", [w for w in batch if w not in found])
+        except Exception:
+            pass
+        CACHE.set_many("openalex", found)
+        return found
+    batches = [wids[i:i+chunk] for i in range(0, len(wids), chunk)]
+    for found in map_batches(fetch_batch, batches, workers):
+        out.update(found)
+    return out
 
 # arXiv batch by id_list
-def parse_arxiv_summary(xml_text):
+def parse_arxiv_summary(xml_bytes):
+    # Atom feed -> {entry id URL: summary}
     ns = {"atom":"http://www.w3.org/2005/Atom"}
     try:
-        root = ET.fromstring(xml_text)
         d = {}
-        for e in root.findall("atom:entry", ns):
+        for e in iter_atom_entries(xml_bytes):
             _id = (e.findtext("atom:id", default="", namespaces=ns) or "").strip()
             summary = e.findtext("atom:summary", default="", namespaces=ns) or ""
             if _id:
-                d[_id] = re.sub(r"\s+", " ", summary).strip()
+                d[_id] = normalize_text(summary)
         return d
     except Exception:
         return {}
 
-def fetch_arxiv_abstracts(arxiv_ids, chunk=50, sleep=1.0):
-    out = {}
-    if not arxiv_ids: return out
+def fetch_arxiv_abstracts(arxiv_ids, chunk=50, workers=1):
+    if not arxiv_ids: return {}
+    # entries are cached under the Atom <id> URL, which is also the record id for arXiv rows
+    out = CACHE.get_many("arxiv", arxiv_ids)
     base = "http://export.arxiv.org/api/query"
     def norm(x):
         if "arxiv.org" in x:
             return x.rstrip("/").split("/")[-1]
         return x
-    ids = [norm(x) for x in arxiv_ids]
-    for i in range(0, len(ids), chunk):
-        id_list = ",".join(ids[i:i+chunk])
+    ids = [norm(x) for x in arxiv_ids if x not in out]
+    def fetch_batch(batch):
+        d = {}
         try:
-            r = requests.get(base, params={"id_list": id_list}, timeout=30)
+            r = request_with_retry("GET", base, ARXIV_LIMIT, params={"id_list": ",".join(batch)}, timeout=30)
             r.raise_for_status()
-            d = parse_arxiv_summary(r.text)
-            out.update(d)
+            d = parse_arxiv_summary(r.content)
         except Exception:
             pass
-        time.sleep(sleep)
+        CACHE.set_many("arxiv", d)
+        return d
+    # arXiv asks clients to stay on a single connection, hence workers=1 by default
+    batches = [ids[i:i+chunk] for i in range(0, len(ids), chunk)]
+    for d in map_batches(fetch_batch, batches, workers):
+        out.update(d)
     return out
 
-def abstract_stage(screened_rows):
+def collect_ids(rows, row_keys=None, openalex_dois=None):
     """
-    For each paper in screened_candidates.csv:
-      - Try fetch abstract via PubMed -> S2 (DOI/PMID) -> OpenAlex -> arXiv
-      - Keep if: no abstract OR (abstract has RL AND MV)
-      - Drop if: abstract present AND missing RL or MV
-    Returns (keepers, dropped, counts_dict)
+    Identifier sets (pmids, dois, openalex_ids, arxiv_ids, s2_ids) for the abstract
+    fetchers; shared ids are fetched once. When a list is passed as `row_keys`,
+    each row's abstract_keys are appended to it in row order from the same parsed
+    fields, so the decision loop does not parse the row a second time.
+    When a dict is passed as `openalex_dois`, it is filled with {W-id: doi} for DOIs
+    that only OpenAlex rows carry (see fetch_abstract_sources).
     """
-    # Collect identifiers
-    pmids, dois, openalex_ids, arxiv_ids = [], [], [], []
-    for r in screened_rows:
+    pmids, dois, openalex_ids, arxiv_ids, s2_ids = set(), set(), set(), set(), set()
+    shared_dois = set()  # DOIs some non-OpenAlex row is looked up by
+    for r in rows:
         src = (r.get("source") or "").lower()
-        rid = r.get("id") or ""
+        rid = str(r.get("id") or "")  # S2 rows may carry an int CorpusId
         doi = (r.get("doi") or "").strip()
         url = r.get("url") or ""
+        if row_keys is not None:
+            row_keys.append(abstract_keys(src, rid, doi, url))
 
         if src == "pubmed" and rid.startswith("PMID:"):
-            pmids.append(rid.split("PMID:")[1])
+            pmids.add(rid.split("PMID:")[1])
+        is_openalex = "openalex.org" in rid or (src == "openalex" and rid)
         if doi:
-            dois.append(doi)
-        if "openalex.org" in rid or (src == "openalex" and rid):
-            openalex_ids.append(rid)
+            dois.add(doi)
+            if is_openalex and openalex_dois is not None:
+                openalex_dois[rid.split("/")[-1]] = doi
+            else:
+                shared_dois.add(doi)
+        elif src == "semantic_scholar":
+            s2_id = s2_batch_id(rid)
+            if s2_id: s2_ids.add(s2_id)  # no DOI to look it up by: ask S2 by its own id
+        if is_openalex:
+            openalex_ids.add(rid)
         if src == "arxiv":
-            if rid: arxiv_ids.append(rid)
-            elif url: arxiv_ids.append(url)
+            if rid: arxiv_ids.add(rid)
+            elif url: arxiv_ids.add(url)
         elif "arxiv.org/abs/" in url:
-            arxiv_ids.append(url)
-
-    pmid_to_abs = fetch_pubmed_abstracts(sorted(set(pmids)))
-    s2_ids = [f"DOI:{d}" for d in sorted(set(dois))]
-    missing_pmids = [p for p in set(pmids) if p not in pmid_to_abs]
-    s2_ids += [f"PMID:{p}" for p in missing_pmids]
-    s2_map = s2_batch_by_ids(s2_ids)
-
-    openalex_map = {}
-    for wid in list(dict.fromkeys(openalex_ids)):
-        a = fetch_openalex_abstract(wid)
-        if a:
-            openalex_map[wid.split("/")[-1]] = a
-        time.sleep(0.2)
-
-    arxiv_map = fetch_arxiv_abstracts(list(dict.fromkeys(arxiv_ids)))
-
-    # Evaluate
-    keepers, dropped = [], []
-    checked = kept = dropped_cnt = noabs = 0
-
-    for r in screened_rows:
-        checked += 1
-        abstract = ""
-        src = (r.get("source") or "").lower()
-        rid = r.get("id") or ""
-        doi = (r.get("doi") or "").strip()
-        url = r.get("url") or ""
-
-        if src == "pubmed" and rid.startswith("PMID:"):
-            pmid = rid.split("PMID:")[1]
-            abstract = pmid_to_abs.get(pmid, "")
-
-        if not abstract and doi:
-            obj = s2_map.get(f"DOI:{doi}")
-            if obj and obj.get("abstract"):
-                abstract = obj["abstract"]
+            arxiv_ids.add(url)
+    if openalex_dois:
+        for wid in [w for w, d in openalex_dois.items() if d in shared_dois]:
+            del openalex_dois[wid]
+    return pmids, dois, openalex_ids, arxiv_ids, s2_ids
 
-        if not abstract and src == "pubmed" and rid.startswith("PMID:"):
-            obj = s2_map.get(f"PMID:{rid.split('PMID:')[1]}")
-            if obj and obj.get("abstract"):
-                abstract = obj["abstract"]
-
-        if not abstract and (src == "openalex" or "openalex.org" in rid):
-            key = rid.split("/")[-1]
-            abstract = openalex_map.get(key, "")
-
-        if not abstract and (src == "arxiv" or "arxiv.org/abs/" in url):
-            abstract = arxiv_map.get(url, "") or arxiv_map.get(rid, "")
-
-        abs_clean = re.sub(r"\s+", " ", abstract or "").strip()
-
-        mv   = abs_matches_any(ABS_MV_RX,   abs_clean)
-        rl   = abs_matches_any(ABS_RL_RX,   abs_clean)
-        wean = abs_matches_any(ABS_WEAN_RX, abs_clean)  # computed but not required
+def fetch_abstract_sources(pmids, dois, openalex_ids, arxiv_ids, s2_ids=(), openalex_dois=None):
+    """
+    Fetch abstracts from all four APIs concurrently. Only the S2 lookup of PMIDs
+    that PubMed missed has to wait for PubMed; the S2 DOI/paperId batch, OpenAlex and
+    arXiv all run in the background, each paced by its own host RateLimiter.
+    DOIs in `openalex_dois` ({W-id: doi}, see collect_ids) wait for OpenAlex instead
+    and go to S2 with the missed PMIDs only when OpenAlex had no abstract for the work.
+    Id arguments are sets; they are sorted only so batches are reproducible.
+    Returns (pmid_to_abs, s2_map, openalex_map, arxiv_map)
+    """
+    if not (pmids or dois or openalex_ids or arxiv_ids or s2_ids):
+        # nothing resolvable (e.g. only Scholar/WoS rows without DOI): every row
+        # ends up keep_no_abstract, so skip the pool and all four APIs
+        return {}, {}, {}, {}
+    pmids = set(pmids)
+    openalex_dois = openalex_dois or {}
+    dois = set(dois) - set(openalex_dois.values())
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        openalex_future = pool.submit(fetch_openalex_abstracts, sorted(openalex_ids))
+        arxiv_future = pool.submit(fetch_arxiv_abstracts, sorted(arxiv_ids))
+        s2_doi_future = pool.submit(s2_batch_by_ids, [f"DOI:{d}" for d in sorted(dois)] + sorted(s2_ids))
+
+        pmid_to_abs = fetch_pubmed_abstracts(sorted(pmids))
+        missing_pmids = pmids - pmid_to_abs.keys()
+        openalex_map = openalex_future.result()
+        late_dois = {d for w, d in openalex_dois.items() if w not in openalex_map}
+        s2_map = s2_doi_future.result()
+        s2_map.update(s2_batch_by_ids([f"DOI:{d}" for d in sorted(late_dois)] +
+                                      [f"PMID:{p}" for p in sorted(missing_pmids)]))
+
+        return pmid_to_abs, s2_map, openalex_map, arxiv_future.result()
+
+def build_abstract_index(pmid_to_abs, s2_map, openalex_map, arxiv_map):
+    """
+    Flatten the per-source fetch results into one {(kind, id): abstract} dict,
+    so each record is resolved with a few dict probes (see abstract_keys)
+    instead of a branchy per-source chain.
+    """
+    index = {}
+    for pmid, a in pmid_to_abs.items():
+        index[("pmid", pmid)] = a
+    for key, obj in s2_map.items():
+        if not obj.get("abstract"): continue
+        if key.startswith("DOI:"):
+            index[("doi", key[4:].lower())] = obj["abstract"]
+        elif key.startswith("PMID:"):
+            index[("s2_pmid", key[5:])] = obj["abstract"]
+        else:  # S2 row's own id (paperId, CorpusId:n or URL:u), see s2_batch_id
+            index[("s2", key)] = obj["abstract"]
+    for wid, a in openalex_map.items():
+        index[("openalex", wid)] = a
+    for aid, a in arxiv_map.items():
+        index[("arxiv", aid)] = a
+    return index
+
+S2_PAPER_ID_RX = re.compile(r"[0-9a-f]{40}")
+
+def s2_batch_id(rid):
+    """
+    The id S2's /paper/batch resolves for a semantic_scholar row's own id: a 40-hex
+    paperId as is, a CorpusId as CorpusId:<n>, a semanticscholar.org URL as URL:<url>.
+    None for the title fallback normalize_semantic_scholar uses when S2 gave no id.
+    """
+    if S2_PAPER_ID_RX.fullmatch(rid): return rid
+    if rid.isdigit(): return f"CorpusId:{rid}"
+    if "semanticscholar.org/" in rid: return f"URL:{rid}"
+    return None
 
+def abstract_keys(src, rid, doi, url):
+    """
+    Index keys for a record's parsed (lower-case source, id, stripped DOI, url), in
+    lookup priority: PubMed -> S2 (DOI) -> S2 (PMID) -> S2 (paperId) -> OpenAlex -> arXiv.
+    """
+    pmid = rid.split("PMID:")[1] if src == "pubmed" and rid.startswith("PMID:") else None
+    keys = []
+    if pmid: keys.append(("pmid", pmid))
+    if doi: keys.append(("doi", doi.lower()))
+    if pmid: keys.append(("s2_pmid", pmid))
+    s2_id = s2_batch_id(rid) if src == "semantic_scholar" else None
+    if s2_id: keys.append(("s2", s2_id))
+    if src == "openalex" or "openalex.org" in rid: keys.append(("openalex", rid.split("/")[-1]))
+    if src == "arxiv" or "arxiv.org/abs/" in url: keys += [("arxiv", url), ("arxiv", rid)]
+    return keys
+
+def lookup_abstract(index, keys):
+    for key in keys:
+        a = index.get(key)
+        if a: return a
+    return ""
+
+def abstract_stage(screened_rows, counts):
+    """
+    For each paper in screened_candidates.csv:
+      - Try fetch abstract via PubMed -> S2 (DOI/PMID) -> OpenAlex -> arXiv
+      - Keep if: no abstract OR (abstract has RL AND MV)
+      - Drop if: abstract present AND missing RL or MV
+    Generator: yields every row with its decision; tallies checked / kept /
+    dropped_by_abstract / no_abstract into `counts` as rows are consumed, so
+    callers can stream kept rows straight to disk.
+    """
+    row_keys, openalex_dois = [], {}
+    pmids, dois, openalex_ids, arxiv_ids, s2_ids = collect_ids(screened_rows, row_keys, openalex_dois)
+    pmid_to_abs, s2_map, openalex_map, arxiv_map = fetch_abstract_sources(
+        pmids, dois, openalex_ids, arxiv_ids, s2_ids, openalex_dois)
+    abstract_index = build_abstract_index(pmid_to_abs, s2_map, openalex_map, arxiv_map)
+
+    # Evaluate (rows are updated in place and yielded one at a time)
+    for r, keys in zip(screened_rows, row_keys):
+        counts["checked"] += 1
+        abstract = lookup_abstract(abstract_index, keys)
+
+        abs_clean = normalize_text(abstract)
+
+        # Stage 2 is always case-insensitive; the Stage 1 automaton is lowercase unless CASE_SENSITIVE
+        if CASE_SENSITIVE:
+            hits = {cat for cat, rx in ABS_CATEGORY_RX.items() if abs_matches_any(rx, abs_clean)}
+        else:
+            hits = keyword_hits(abs_clean) if abs_clean else set()
+        mv   = "mv" in hits
+        rl   = "rl" in hits
+        wean = "wean" in hits  # computed but not required
+
+        r["abstract"] = abs_clean
+        r["match_mv_abs"] = mv
+        r["match_wean_abs"] = wean
+        r["match_rl_abs"] = rl
         if not abs_clean:
             # No abstract found -> KEEP
-            r2 = dict(r)
-            r2["abstract"] = ""
-            r2["match_mv_abs"] = False
-            r2["match_wean_abs"] = False
-            r2["match_rl_abs"] = False
-            r2["decision"] = "keep_no_abstract"
-            keepers.append(r2)
-            kept += 1
-            noabs += 1
+            r["decision"] = "keep_no_abstract"
+            counts["kept"] += 1
+            counts["no_abstract"] += 1
+        elif mv and rl:
+            # Abstract has BOTH RL & MV -> KEEP
+            r["decision"] = "keep"
+            counts["kept"] += 1
         else:
-            if mv and rl:
-                # Abstract has BOTH RL & MV -> KEEP
-                r2 = dict(r)
-                r2["abstract"] = abs_clean
-                r2["match_mv_abs"] = mv
-                r2["match_wean_abs"] = wean
-                r2["match_rl_abs"] = rl
-                r2["decision"] = "keep"
-                keepers.append(r2)
-                kept += 1
-            else:
-                # Abstract present but missing RL or MV -> DROP
-                r2 = dict(r)
-                r2["abstract"] = abs_clean
-                r2["match_mv_abs"] = mv
-                r2["match_wean_abs"] = wean
-                r2["match_rl_abs"] = rl
-                r2["decision"] = "drop_by_abstract"
-                dropped.append(r2)
-                dropped_cnt += 1
-
-    counts = {
-        "checked": checked,
-        "kept": kept,
-        "dropped_by_abstract": dropped_cnt,
-        "no_abstract": noabs
-    }
-    return keepers, dropped, counts
+            # Abstract present but missing RL or MV -> DROP
+            r["decision"] = "drop_by_abstract"
+            counts["dropped_by_abstract"] += 1
+        yield r
 
 # ------------------ Main ------------------------
 
 def main():
     # -------- Stage 1: normalize -> dedup -> keyword screen --------
-    all_records = []
-    all_records += normalize_google_scholar()
-    all_records += normalize_semantic_scholar()
-    all_records += normalize_openalex()
-    all_records += normalize_arxiv()
-    all_records += normalize_scopus()
-    all_records += normalize_wos()
-    all_records += normalize_pubmed()  # PMIDs only (URLs; refine later if you fetch details)
-
-    dedup = deduplicate(all_records)
-    screened_in, screened_out = apply_filters(dedup)
+    all_records = normalize_all_sources()  # PubMed gives PMIDs only (URLs; refine later if you fetch details)
+    raw_total = len(all_records)
 
-    cols = ["source","id","title","authors","year","doi","url","venue"]
-    write_jsonl(OUT / "unified_all.jsonl", dedup)
-    write_csv(OUT / "unified_all.csv", dedup, cols)
+    clusters = cluster_by_ids(all_records)
+    dedup, screened_in, screened_out = dedup_and_screen(all_records, clusters)
 
-    write_csv(OUT / "screened_candidates.csv", screened_in, cols + ["match_mv","match_weaning","match_rl"])
-    write_csv(OUT / "excluded_non_mv_weaning.csv", screened_out, cols + ["auto_exclude_reason"])
+    cols = ["source","id","title","authors","year","doi","url","venue"]
+    # independent files: overlap their disk writes instead of running them back to back
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        writes = [
+            pool.submit(write_clusters, OUT / "clusters.json", clusters),
+            pool.submit(write_jsonl_csv, OUT / "unified_all.jsonl", OUT / "unified_all.csv", dedup, cols),
+            pool.submit(write_parquet, OUT / "unified_all.parquet", dedup, cols),
+            pool.submit(write_csv, OUT / "screened_candidates.csv", screened_in, cols + ["match_mv","match_weaning","match_rl"]),
+            pool.submit(write_csv, OUT / "excluded_non_mv_weaning.csv", screened_out, cols + ["auto_exclude_reason"]),
+        ]
+        for fut in writes:
+            fut.result()
+    # Stage 2 only needs screened_in: clusters holds every raw record and dedup every
+    # unified one, so once the Stage 1 files are written keep their counts and drop the rest
+    n_clusters, n_dedup, n_screened_out = len(clusters), len(dedup), len(screened_out)
+    del all_records, clusters, dedup, screened_out
 
     prisma = {
-        "identified_raw_total": len(all_records),
-        "after_dedup": len(dedup),
+        "identified_raw_total": raw_total,
+        "identifier_clusters": n_clusters,
+        "after_dedup": n_dedup,
         "auto_screen_in": len(screened_in),
-        "auto_screen_out": len(screened_out),
+        "auto_screen_out": n_screened_out,
         "notes": {
             "strict_require_rl": STRICT_REQUIRE_RL,
             "mv_terms": MV_TERMS,
@@ -666,25 +1457,18 @@ def main():
     }
 
     # -------- Stage 2: abstract scan on screened_candidates --------
-    if screened_in:
-        kept, dropped, abs_counts = abstract_stage(screened_in)
-
-        # Save KEPT ONLY as abstract_check.*
-        abs_cols = ["source","id","title","authors","year","doi","url","venue",
-                    "abstract","match_mv_abs","match_wean_abs","match_rl_abs","decision"]
-        write_csv(OUT / "abstract_check.csv", kept, abs_cols)
-        write_jsonl(OUT / "abstract_check.jsonl", kept)
-
-        # Update PRISMA counts
-        prisma["abstract_stage"] = abs_counts
-        prisma["auto_screen_in_after_abstract"] = prisma["auto_screen_in"] - abs_counts["dropped_by_abstract"]
-    else:
-        # No screened_in -> write empty abstract files and keep counts neutral
-        write_csv(OUT / "abstract_check.csv", [], ["source","id","title","authors","year","doi","url","venue",
-                                                   "abstract","match_mv_abs","match_wean_abs","match_rl_abs","decision"])
-        write_jsonl(OUT / "abstract_check.jsonl", [])
-        prisma["abstract_stage"] = {"checked": 0, "kept": 0, "dropped_by_abstract": 0, "no_abstract": 0}
-        prisma["auto_screen_in_after_abstract"] = 0
+    # (with no screened_in this writes empty abstract files and zero counts)
+    abs_counts = {"checked": 0, "kept": 0, "dropped_by_abstract": 0, "no_abstract": 0}
+    abs_cols = ["source","id","title","authors","year","doi","url","venue",
+                "abstract","match_mv_abs","match_wean_abs","match_rl_abs","decision"]
+
+    # Save KEPT ONLY as abstract_check.*, streamed straight from the decision loop
+    kept = (r for r in abstract_stage(screened_in, abs_counts) if r["decision"] != "drop_by_abstract")
+    write_jsonl_csv(OUT / "abstract_check.jsonl", OUT / "abstract_check.csv", kept, abs_cols)
+
+    # Update PRISMA counts
+    prisma["abstract_stage"] = abs_counts
+    prisma["auto_screen_in_after_abstract"] = prisma["auto_screen_in"] - abs_counts["dropped_by_abstract"]
 
     # Persist PRISMA
     with (OUT / "prisma_counts.json").open("w", encoding="utf-8") as f:
@@ -692,9 +1476,9 @@ def main():
 
     # Logs
     print("\nStage 1 complete.")
-    print(f"- Normalized & de-duplicated: {OUT/'unified_all.csv'}  (n={len(dedup)})")
+    print(f"- Normalized & de-duplicated: {OUT/'unified_all.csv'}  (n={n_dedup})")
     print(f"- Screened candidates (MV+weaning): {OUT/'screened_candidates.csv'}  (n={len(screened_in)})")
-    print(f"- Auto-excluded: {OUT/'excluded_non_mv_weaning.csv'}  (n={len(screened_out)})")
+    print(f"- Auto-excluded: {OUT/'excluded_non_mv_weaning.csv'}  (n={n_screened_out})")
     print("Stage 2 abstract scan:")
     print(f"- abstract_check.csv written with KEPT items only.")
 
@@ -1,8 +1,28 @@
-import requests, time, os, json
-import xml.etree.ElementTree as ET
+import requests, time, os, json, gzip, re, threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING  # "gzip,deflate", plus br/zstd when their decoders are installed
+try:
+    from lxml import etree as ET  # optional (pip install lxml): C-speed XML parsing, same find API
+except ImportError:
+    import xml.etree.ElementTree as ET
 from pathlib import Path
 from dotenv import load_dotenv
 import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import orjson  # optional (pip install orjson): faster serialization of the raw dumps
+except ImportError:
+    orjson = None
+try:
+    import zstandard  # optional (pip install zstandard): SEARCH_ZSTD_RAW=1 zstd raw dumps
+except ImportError:
+    zstandard = None
+try:
+    import requests_cache  # optional (pip install requests-cache): on-disk response cache for reruns
+except ImportError:
+    requests_cache = None
 
 load_dotenv()
 
@@ -10,19 +30,217 @@ load_dotenv()
 BASE_DIR = Path("paper_list")
 RAW_DIR = BASE_DIR / "raw"
 RAW_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR = BASE_DIR / "cache"  # untracked (see .gitignore), shared with filter.py's abstract cache
+# SEARCH_GZIP_RAW=1 writes the raw dumps as <name>.json.gz, SEARCH_ZSTD_RAW=1 as <name>.json.zst
+# (smaller and faster than gzip; needs zstandard). The normalizers read any of the three forms.
+GZIP_RAW = os.getenv("SEARCH_GZIP_RAW", "").lower() in ("1", "true", "yes")
+ZSTD_RAW = os.getenv("SEARCH_ZSTD_RAW", "").lower() in ("1", "true", "yes")
+if ZSTD_RAW and zstandard is None:
+    raise ImportError("SEARCH_ZSTD_RAW=1 needs zstandard (pip install zstandard)")
+RAW_SUFFIX = ".zst" if ZSTD_RAW else ".gz" if GZIP_RAW else ""
+
+def raw_paths(path):
+    """(file to write, siblings in the other formats to remove afterwards) for RAW_DIR/path."""
+    plain = RAW_DIR / path
+    forms = [plain.with_name(plain.name + suffix) for suffix in ("", ".gz", ".zst")]
+    out = plain.with_name(plain.name + RAW_SUFFIX)
+    return out, [f for f in forms if f != out]
+
+def open_raw(out_path):
+    if RAW_SUFFIX == ".zst":
+        return zstandard.ZstdCompressor(level=6).stream_writer(open(out_path, "wb"))
+    if RAW_SUFFIX == ".gz":
+        return gzip.open(out_path, "wb", compresslevel=6)
+    return open(out_path, "wb")
 
 def save_json(path, data):
-    out_path = RAW_DIR / path
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    out_path, stale = raw_paths(path)
+    # plain dumps stay 2-space indented for reading by eye; compressed ones are compact
+    indent = 2 if not RAW_SUFFIX else None
+    if orjson is not None:
+        # same UTF-8 layout as json.dumps below, serialized in one C call;
+        # NON_STR_KEYS stringifies int keys the way json does instead of raising
+        blob = orjson.dumps(data, option=(orjson.OPT_INDENT_2 if indent else 0) | orjson.OPT_NON_STR_KEYS)
+    else:
+        blob = json.dumps(data, ensure_ascii=False, indent=indent).encode("utf-8")
+    # one write to a temp file, then an atomic rename: a crash never leaves a truncated dump
+    tmp_path = out_path.with_name(out_path.name + ".part")
+    with open_raw(tmp_path) as f:
+        f.write(blob)
+    os.replace(tmp_path, out_path)
+    for f in stale:
+        f.unlink(missing_ok=True)  # never leave an older dump in another format for readers to find
     print(f"Saved → {out_path}")
 
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+def json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+class JsonArrayWriter:
+    """
+    Write {**head, key: [...], **tail} to RAW_DIR/path while the array is still
+    being fetched: each page's items go straight to disk (one per line), so a
+    long pagination never holds every item in memory. Same JSON object the
+    normalizers read with iter_items; the file only appears once complete, and
+    is discarded if the fetch fails part-way.
+
+    With resume=True (plain dumps only: a compressed stream cannot be cut back),
+    checkpoint(state) marks everything written so far as final together with
+    the fetcher's cursor/offset. A fetch that dies then leaves <name>.part and
+    <name>.cursor behind; the next run with the same head reopens the .part at
+    the last checkpoint and hands the state back as .resumed.
+    """
+    def __init__(self, path, head, key, resume=False):
+        self.out_path, self.stale_paths = raw_paths(path)
+        self.tmp_path = self.out_path.with_name(self.out_path.name + ".part")
+        self.cursor_path = self.out_path.with_name(self.out_path.name + ".cursor")
+        self.head = head
+        self.resumable = resume and not RAW_SUFFIX
+        self.resumed = self._reopen() if self.resumable else None
+        if self.resumed is not None:
+            return
+        self.f = open_raw(self.tmp_path)
+        self.count = 0
+        self.f.write(b"{\n")
+        for k, v in head.items():
+            self.f.write(b"  " + _dumps(k) + b": " + _dumps(v) + b",\n")
+        self.f.write(b"  " + _dumps(key) + b": [")
+
+    def _reopen(self):
+        """Open the .part at its last checkpoint; the saved state, or None to start over."""
+        try:
+            cp = json_loads(self.cursor_path.read_bytes())
+            f = open(self.tmp_path, "r+b")
+        except (OSError, ValueError):
+            return None
+        if cp.get("head") != self.head:  # a different query: that partial dump is not ours to extend
+            f.close()
+            self.cursor_path.unlink(missing_ok=True)
+            return None
+        f.truncate(cp["size"])  # drop whatever was written after the checkpoint
+        f.seek(cp["size"])
+        self.f, self.count = f, cp["count"]
+        print(f"Resuming {self.out_path} after {self.count} items")
+        return cp["state"]
+
+    def checkpoint(self, state):
+        """Everything written so far is final; `state` is what the fetcher needs to continue after it."""
+        if not self.resumable:
+            return
+        self.f.flush()
+        cp = {"head": self.head, "size": self.f.tell(), "count": self.count, "state": state}
+        tmp = self.cursor_path.with_name(self.cursor_path.name + ".part")
+        tmp.write_bytes(_dumps(cp))
+        os.replace(tmp, self.cursor_path)
+
+    def extend(self, items):
+        for it in items:
+            self.f.write((b",\n    " if self.count else b"\n    ") + _dumps(it))
+            self.count += 1
+
+    def close(self, tail):
+        self.f.write(b"\n  ]" if self.count else b"]")
+        for k, v in tail.items():
+            self.f.write(b",\n  " + _dumps(k) + b": " + _dumps(v))
+        self.f.write(b"\n}")
+        self.f.close()
+        os.replace(self.tmp_path, self.out_path)
+        self.cursor_path.unlink(missing_ok=True)
+        for f in self.stale_paths:
+            f.unlink(missing_ok=True)
+        print(f"Saved → {self.out_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.f.closed:  # close() was never reached: drop the partial file unless it can resume
+            self.f.close()
+            if not (self.resumable and self.cursor_path.exists()):
+                self.tmp_path.unlink(missing_ok=True)
+
 def save_text(path, text):
     out_path = RAW_DIR / path
     with open(out_path, "w", encoding="utf-8") as f:
         f.write(text)
     print(f"Saved → {out_path}")
 
+# !! IMPORTANT: Update your email address below to comply with arXiv's policy !!
+UA = "rl-mv-weaning-review/0.1 (mailto:your_email@example.com)"
+
+# One pooled Session for every source: paginated calls to the same host reuse
+# the TCP+TLS connection instead of a fresh handshake per page.
+# urllib3 retries connect/read failures, transient 5xx and 429 (sleeping for the
+# server's Retry-After when sent), then returns the last response for raise_for_status;
+# get_with_retry adds its longer 429 backoff on top for S2/Scopus/WoS. POST is only the
+# PubMed EFetch read, so it is retried like GET.
+# Set SEARCH_CACHE_DAYS>0 (and install requests-cache) to replay GET responses from
+# paper_list/cache/http_cache.sqlite on reruns; off by default so a real run always
+# reflects today's databases. api_key-style params are excluded from cache keys, and
+# a fresh cache hit skips the host's RateLimiter (see pace) since nothing goes on the wire.
+CACHE_DAYS = float(os.getenv("SEARCH_CACHE_DAYS") or 0)
+if requests_cache is not None and CACHE_DAYS > 0:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    SESSION = requests_cache.CachedSession(str(CACHE_DIR / "http_cache"), backend="sqlite",
+                                           expire_after=CACHE_DAYS * 24 * 3600, allowable_methods=["GET"])
+else:
+    SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": UA, "Accept-Encoding": ACCEPT_ENCODING})
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                       max_retries=Retry(total=None, connect=3, read=3, status=3, backoff_factor=0.5,
+                                         status_forcelist=[429, 500, 502, 503, 504],
+                                         allowed_methods=["GET", "POST"], respect_retry_after_header=True,
+                                         raise_on_status=False))
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+class RateLimiter:
+    """
+    Thread-safe per-host limiter: at most `rate` requests per `period` seconds.
+    Concurrent workers hitting the same host share one instance, so the host's
+    politeness budget holds however many queries are in flight.
+    """
+    def __init__(self, rate, period=1.0):
+        self.interval = period / rate
+        self.next_at = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_at)
+            self.next_at = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def hold(self, seconds):
+        """Server asked us to back off (429): no worker on this host starts a request for `seconds`."""
+        with self.lock:
+            self.next_at = max(self.next_at, time.monotonic() + seconds)
+
+# One limiter per host, shared by every request to it; the cadence is measured from
+# request start, so a slow response is not followed by a full extra sleep.
+PUBMED_LIMIT   = RateLimiter(3, 1.0)   # NCBI E-utilities without an API key
+OPENALEX_LIMIT = RateLimiter(10, 1.0)  # OpenAlex polite pool
+S2_LIMIT       = RateLimiter(1, 1.0)   # Semantic Scholar public tier
+ARXIV_LIMIT    = RateLimiter(1, 3.0)   # arXiv: ~3s between calls
+SCOPUS_LIMIT   = RateLimiter(1, 1.0)
+WOS_LIMIT      = RateLimiter(1, 1.0)
+SERPAPI_LIMIT  = RateLimiter(1, 1.0)
+
+def pace(limiter, url, params=None, headers=None):
+    """limiter.wait(), unless SESSION will answer this GET from its on-disk cache."""
+    if isinstance(SESSION, requests.Session) and hasattr(SESSION, "cache"):
+        req = SESSION.prepare_request(requests.Request("GET", url, params=params, headers=headers))
+        cached = SESSION.cache.get_response(SESSION.cache.create_key(req))
+        if cached is not None and not cached.is_expired:
+            return
+    limiter.wait()
+
 def get_with_retry(
     url,
     headers=None,
@@ -30,15 +248,19 @@ def get_with_retry(
     timeout=30,
     max_retries=10,
     base_sleep=10,
+    limiter=None,
 ):
     """
-    Wrapper around requests.get that:
+    Wrapper around SESSION.get that:
+      - Paces every attempt through the host's RateLimiter, when given
       - Retries on HTTP 429 (Too Many Requests)
       - Respects Retry-After header when present
       - Raises on 401/403 so credential issues are obvious
     """
     for attempt in range(max_retries):
-        r = requests.get(url, headers=headers, params=params, timeout=timeout)
+        if limiter is not None:
+            pace(limiter, url, params, headers)
+        r = SESSION.get(url, headers=headers, params=params, timeout=timeout)
 
         # Handle rate limiting explicitly
         if r.status_code == 429:
@@ -52,7 +274,10 @@ def get_with_retry(
                 # simple linear backoff
                 sleep_sec = base_sleep * (attempt + 1)
             print(f"[429] Too Many Requests for {url}. Sleeping {sleep_sec}s (attempt {attempt+1}/{max_retries})")
-            time.sleep(sleep_sec)
+            if limiter is not None:
+                limiter.hold(sleep_sec)  # every thread on this host cools down; wait() above sleeps it off
+            else:
+                time.sleep(sleep_sec)
             continue
 
         # Explicitly surface auth/entitlement issues
@@ -84,387 +309,537 @@ WEAN = '(wean*[tiab] OR extubat*[tiab] OR "ventilator liberation"[tiab] OR "spon
 term = f"({RL}) AND ({MV}) AND ({WEAN})"
 print("PubMed Search Term:\n", term)  # Print the final expanded search term
 
-try:
-    url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-    base_params = {"db": "pubmed", "retmode": "json", "term": term}
-
-    # get total count
-    r = requests.get(url, params={**base_params, "retmax": 0}, timeout=30)
-    r.raise_for_status()
-    info = r.json()
-    total = int(info["esearchresult"]["count"])
-    print("PubMed count:", total)
-
-    # fetch all PMIDs in chunks
-    RETMAX = 10000
-    all_pmids, pages = [], 0
-    for start in range(0, total, RETMAX):
-        r = requests.get(url, params={**base_params, "retstart": start, "retmax": RETMAX}, timeout=30)
+def fetch_pubmed():
+    """PubMed esearch: every PMID for `term` → pubmed_esearch_all.json."""
+    try:
+        url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+        efetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+        RETMAX = 10000
+
+        # one ESearch returns the count, the first page of PMIDs and a history-server handle
+        esearch_params = {"db": "pubmed", "retmode": "json", "term": term,
+                          "retmax": RETMAX, "usehistory": "y"}
+        pace(PUBMED_LIMIT, url, esearch_params)
+        r = SESSION.get(url, params=esearch_params, timeout=30)
         r.raise_for_status()
-        data = r.json()
-        pmids = data["esearchresult"].get("idlist", [])
-        all_pmids.extend(pmids)
-        pages += 1
-        print(f"PubMed page {pages} (retstart={start}) fetched: {len(pmids)}")
-        time.sleep(0.34)  # polite pacing
-
-    save_json("pubmed_esearch_all.json", {
-        "term": term,
-        "pages_fetched": pages,
-        "total_reported": total,
-        "total_pmids_concat": len(all_pmids),
-        "pmids": all_pmids
-    })
-except Exception as e:
-    save_text("pubmed_ERROR.txt", str(e))
+        info = json_loads(r.content)["esearchresult"]
+        total = int(info["count"])
+        print("PubMed count:", total)
+
+        all_pmids = list(info.get("idlist", []))
+        pages = 1 if total else 0
+        print(f"PubMed page {pages} (retstart=0) fetched: {len(all_pmids)}")
+
+        # remaining pages come from the stored result set; ESearch itself stops at 10,000 ids.
+        # They are independent reads of that set, so a few run at once under PUBMED_LIMIT.
+        def fetch_page(start):
+            PUBMED_LIMIT.wait()
+            r = SESSION.post(efetch_url, data={"db": "pubmed", "WebEnv": info["webenv"], "query_key": info["querykey"],
+                                               "retstart": start, "retmax": RETMAX,
+                                               "rettype": "uilist", "retmode": "text"}, timeout=60)
+            r.raise_for_status()
+            pmids = r.text.split()
+            print(f"PubMed page (retstart={start}) fetched: {len(pmids)}")
+            return pmids
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            for pmids in pool.map(fetch_page, range(RETMAX, total, RETMAX)):  # retstart order
+                all_pmids.extend(pmids)
+                pages += 1
+
+        save_json("pubmed_esearch_all.json", {
+            "term": term,
+            "pages_fetched": pages,
+            "total_reported": total,
+            "total_pmids_concat": len(all_pmids),
+            "pmids": all_pmids
+        })
+    except Exception as e:
+        save_text("pubmed_ERROR.txt", str(e))
+
+# -------------------- shared free-text query ----------------------------------------------
+# One concept spec for the free-text engines (OpenAlex, Semantic Scholar, Google Scholar),
+# rendered in each API's syntax so their queries cannot drift apart. PubMed, arXiv, Scopus
+# and WoS keep their own field-tagged strings.
+QUERY_SPEC = {
+    "rl": ["reinforcement learning", "Q-learning", "PPO", "DQN", "markov decision", "MDP"],
+    "mv": ["mechanical ventilation", "ventilator", "ventilatory support"],
+    "wean": ["wean", "extubat", "spontaneous breathing trial"],
+}
+S2_WORDS = {"wean": "weaning", "extubat": "extubation"}  # S2 has no stemming: spell the stems out
+
+def build_query(or_, and_, words=None):
+    """QUERY_SPEC as (t1 <or_> t2 ...) <and_> (...): multi-word and hyphenated terms are quoted."""
+    words = words or {}
+    def term(t):
+        t = words.get(t, t)
+        return f'"{t}"' if " " in t or "-" in t else t
+    return and_.join("(" + or_.join(map(term, terms)) + ")" for terms in QUERY_SPEC.values())
+
+# SEARCH_EARLY_STOP=1 lets Google Scholar, the one relevance-ranked engine here, stop paging once
+# the last STOP_WINDOW pages averaged under STOP_MIN_RELEVANCE on-topic titles (an RL term
+# and a ventilation term). Off by default: a systematic search normally pages to the end.
+# S2 is not eligible: /paper/search/bulk does not rank by relevance, so off-topic pages say
+# nothing about the pages after them.
+EARLY_STOP = os.getenv("SEARCH_EARLY_STOP", "").lower() in ("1", "true", "yes")
+STOP_WINDOW, STOP_MIN_RELEVANCE = 3, 0.1
+RL_TITLE_RX, MV_TITLE_RX = (re.compile(r"\b(?:" + "|".join(map(re.escape, QUERY_SPEC[k])) + r")", re.IGNORECASE)
+                            for k in ("rl", "mv"))
+
+class RelevanceStop:
+    """update(titles) per page; True once EARLY_STOP is on and recent pages have gone off-topic."""
+    def __init__(self):
+        self.recent = deque(maxlen=STOP_WINDOW)
+
+    def update(self, titles):
+        titles = [t for t in titles if t]
+        hits = sum(1 for t in titles if RL_TITLE_RX.search(t) and MV_TITLE_RX.search(t))
+        self.recent.append(hits / len(titles) if titles else 0.0)
+        return (EARLY_STOP and len(self.recent) == STOP_WINDOW
+                and sum(self.recent) / STOP_WINDOW < STOP_MIN_RELEVANCE)
 
 # -------------------- OpenAlex ------------------------------------------------------------
-try:
-    # Expanded OpenAlex search to include key RL acronyms for robustness
-    search = ('("reinforcement learning" OR "Q-learning" OR PPO OR DQN OR "markov decision" OR MDP) '
-              '("mechanical ventilation" OR ventilator OR "ventilatory support") '
-              '(wean OR extubat OR "spontaneous breathing trial")')
-    print("OpenAlex Search Term:\n", search)
-
-    BASE = "https://api.openalex.org/works"
-    PER_PAGE = 200       # OpenAlex max per page
-    cursor = "*"         # cursor-based pagination
-    SLEEP_SEC = 0.2
-
-    all_items, pages = [], 0
-    total_reported = None
-    while True:
-        r = requests.get(BASE, params={"search": search, "per-page": PER_PAGE, "cursor": cursor}, timeout=30)
-        r.raise_for_status()
-        data = r.json()
-        if total_reported is None:
-            total_reported = (data.get("meta") or {}).get("count")
+def fetch_openalex():
+    """OpenAlex works search, cursor-paginated → openalex_all.json."""
+    try:
+        # Expanded OpenAlex search to include key RL acronyms for robustness; groups AND implicitly
+        search = build_query(" OR ", " ")
+        print("OpenAlex Search Term:\n", search)
+
+        BASE = "https://api.openalex.org/works"
+        PER_PAGE = 200       # OpenAlex max per page
+        # A cursor chain is inherently serial, so split the search into independent
+        # publication_year slices (covering every year) and walk their chains in parallel.
+        FIRST_YEAR, LAST_YEAR = 2010, time.localtime().tm_year
+        SLICES = ([f"publication_year:<{FIRST_YEAR}"]
+                  + [f"publication_year:{y}" for y in range(FIRST_YEAR, LAST_YEAR + 1)]
+                  + [f"publication_year:>{LAST_YEAR}"])
+        MAX_WORKERS = 5
+        # only what normalize_openalex reads: skips concepts, referenced_works, abstracts, ...
+        SELECT = "id,doi,ids,display_name,publication_year,authorships,primary_location"
+
+        base_params = {"search": search, "per-page": PER_PAGE, "select": SELECT}
+
+        def fetch_slice(flt):
+            """Follow one cursor chain; return (items, pages, reported count) for the slice."""
+            cursor = "*"         # cursor-based pagination
+            slice_params = {**base_params, "filter": flt}
+            items_all, pages, count = [], 0, 0
+            while True:
+                page_params = {**slice_params, "cursor": cursor}
+                pace(OPENALEX_LIMIT, BASE, page_params)
+                r = SESSION.get(BASE, params=page_params, timeout=30)
+                r.raise_for_status()
+                data = json_loads(r.content)
+                if not pages:
+                    count = (data.get("meta") or {}).get("count") or 0
+                items = data.get("results", [])
+                items_all.extend(items)
+                pages += 1
+                nxt = (data.get("meta") or {}).get("next_cursor")
+                print(f"OpenAlex {flt} page {pages} fetched: {len(items)}")
+                if not nxt or not items:
+                    break
+                cursor = nxt
+            return items_all, pages, count
+
+        seen = set()
+        with JsonArrayWriter("openalex_all.json", {"search": search, "per_page": PER_PAGE}, "items",
+                             resume=True) as out, \
+                ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            # a rerun after a crash skips the slices already on disk
+            state = out.resumed or {"slices": [], "pages": 0, "total_reported": 0}
+            done, pages, total_reported = state["slices"], state["pages"], state["total_reported"]
+            todo = [flt for flt in SLICES if flt not in done]
+            # map() hands slices back in SLICES order, so the output order is stable
+            for flt, (items, n_pages, count) in zip(todo, pool.map(fetch_slice, todo)):
+                pages += n_pages
+                total_reported += count
+                fresh = []
+                for it in items:  # slices are disjoint, but never write a work twice
+                    if it.get("id") not in seen:
+                        seen.add(it.get("id"))
+                        fresh.append(it)
+                out.extend(fresh)
+                done.append(flt)
+                out.checkpoint({"slices": done, "pages": pages, "total_reported": total_reported})
             print("OpenAlex total (reported):", total_reported)
-        items = data.get("results", [])
-        all_items.extend(items)
-        pages += 1
-        nxt = (data.get("meta") or {}).get("next_cursor")
-        print(f"OpenAlex page {pages} fetched: {len(items)}")
-        if not nxt or not items:
-            break
-        cursor = nxt
-        time.sleep(SLEEP_SEC)
-
-    save_json("openalex_all.json", {
-        "search": search,
-        "per_page": PER_PAGE,
-        "pages_fetched": pages,
-        "total_reported": total_reported,
-        "total_items_concat": len(all_items),
-        "items": all_items
-    })
-except Exception as e:
-    save_text("openalex_ERROR.txt", str(e))
+
+            out.close({
+                "pages_fetched": pages,
+                "total_reported": total_reported,
+                "total_items_concat": out.count,
+            })
+    except Exception as e:
+        save_text("openalex_ERROR.txt", str(e))
 
 # -------------------- Semantic Scholar --------------------
 # from inside the original code: import os, math, time, json, requests
-try:
-    # Expanded Semantic Scholar query (similar expansion as OpenAlex)
-    query = ('("reinforcement learning" OR "Q-learning" OR PPO OR DQN OR "markov decision" OR MDP) '
-             'AND ("mechanical ventilation" OR ventilator OR "ventilatory support") '
-             'AND (weaning OR extubation OR "spontaneous breathing trial")')
-    print("Semantic Scholar Search Term:\n", query)
-
-    BASE = "https://api.semanticscholar.org/graph/v1/paper/search"
-    FIELDS = "paperId,title,year,venue,url,externalIds,authors"
-    LIMIT = 100          # max allowed per page
-    MAX_PAGES = 50       # safety cap
-    SLEEP_SEC = 0.6
-
-    S2_API_KEY = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
-    headers = {"x-api-key": S2_API_KEY} if S2_API_KEY else {}
-
-    # 1) Probe to get total results (with retry)
-    r0 = get_with_retry(
-        BASE,
-        headers=headers,
-        params={"query": query, "limit": 1, "offset": 0, "fields": "paperId"},
-        timeout=30,
-    )
-    total = r0.json().get("total", 0)
-    print("Semantic Scholar total (reported):", total)
-
-    all_items = []
-    pages = min(MAX_PAGES, math.ceil(total / LIMIT)) if total else 0
-
-    # 2) Page safely (stop if API says no more data or data is empty)
-    for page in range(pages):
-        offset = page * LIMIT
-        r = get_with_retry(
-            BASE,
-            headers=headers,
-            params={"query": query, "limit": LIMIT, "offset": offset, "fields": FIELDS},
-            timeout=30,
-        )
-        if r.status_code == 400:
-            print(f"S2: stopping early at offset={offset} (no more data).")
-            break
-
-        data = r.json().get("data", []) or []
-        if not data:
-            print(f"S2: empty page at offset={offset}; stopping.")
-            break
-
-        all_items.extend(data)
-        print(f"S2 page {page+1}/{pages} (offset={offset}) fetched: {len(data)}")
-        time.sleep(SLEEP_SEC)
-
-    # 3) Save a single consolidated JSON
-    save_json("semanticscholar_all.json", {
-        "query": query,
-        "fields": FIELDS,
-        "limit_per_page": LIMIT,
-        "pages_attempted": pages,
-        "total_reported": total,
-        "total_items_concat": len(all_items),
-        "items": all_items
-    })
-
-except Exception as e:
-    with open(RAW_DIR / "semanticscholar_ERROR.txt", "w", encoding="utf-8") as f:
-        f.write(str(e))
-    print("Semantic Scholar fetch failed:", e)
+def fetch_semantic_scholar():
+    """Semantic Scholar bulk paper search, token-paginated → semanticscholar_all.json."""
+    try:
+        # Expanded Semantic Scholar query (same spec as OpenAlex), in the bulk
+        # endpoint's boolean syntax: "+" is AND, "|" is OR, quotes are phrases
+        query = build_query(" | ", " + ", S2_WORDS)
+        print("Semantic Scholar Search Term:\n", query)
+
+        # /search/bulk pages with a continuation token (up to 1000 per call) instead of
+        # offset paging, which is capped at 1,000 results and rescans for deep offsets
+        BASE = "https://api.semanticscholar.org/graph/v1/paper/search/bulk"
+        FIELDS = "paperId,title,year,venue,url,externalIds,authors"
+        LIMIT = 1000         # fixed page size of the bulk endpoint
+        MAX_PAGES = 10       # safety cap
+
+        S2_API_KEY = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+        headers = {"x-api-key": S2_API_KEY} if S2_API_KEY else {}
+
+        # Follow the token until the API stops returning one (or the safety cap);
+        # the first page also reports the total, so no separate probe.
+        head = {"query": query, "fields": FIELDS, "limit_per_page": LIMIT}
+        base_params = {"query": query, "fields": FIELDS}  # only "token" changes per page
+        with JsonArrayWriter("semanticscholar_all.json", head, "items", resume=True) as out:
+            token, pages, total = None, 0, 0
+            if out.resumed:  # a rerun after a crash continues from the last token on disk
+                token, pages, total = out.resumed["token"], out.resumed["pages"], out.resumed["total"]
+            while pages < MAX_PAGES and (token or not pages):
+                r = get_with_retry(
+                    BASE,
+                    headers=headers,
+                    params={**base_params, "token": token} if token else base_params,
+                    timeout=30,
+                    limiter=S2_LIMIT,
+                )
+                body = json_loads(r.content)
+                if not pages:
+                    total = body.get("total", 0)
+                    print("Semantic Scholar total (reported):", total)
+                pages += 1
+
+                data = body.get("data", []) or []
+                out.extend(data)
+                print(f"S2 page {pages} fetched: {len(data)}")
+                token = body.get("token") if data else None
+                out.checkpoint({"token": token, "pages": pages, "total": total})
+                if not token:
+                    break
+
+            out.close({
+                "pages_attempted": pages,
+                "total_reported": total,
+                "total_items_concat": out.count,
+            })
+
+    except Exception as e:
+        with open(RAW_DIR / "semanticscholar_ERROR.txt", "w", encoding="utf-8") as f:
+            f.write(str(e))
+        print("Semantic Scholar fetch failed:", e)
 
 # -------------------- arXiv (robust) ------------------------------------------------------------
-try:
-    BASE = "http://export.arxiv.org/api/query"
-    # Keep original arXiv query structure, which is already quite robust for keyword searching
-    QUERIES = [
-        'all:"reinforcement learning" AND all:"mechanical ventilation" AND all:wean',
-        'all:"reinforcement learning" AND all:"mechanical ventilation" AND all:extubat',
-        'all:"reinforcement learning" AND all:"mechanical ventilation" AND all:"spontaneous breathing trial"',
-        'all:"reinforcement learning" AND all:ventilator AND all:wean',
-        'all:"reinforcement learning" AND all:ventilator AND all:extubat',
-    ]
-    FALLBACK = 'all:"reinforcement learning" AND (all:"mechanical ventilation" OR all:ventilator)'
-
-    MAX_RESULTS = 200     # arXiv allows up to 300, but 200 is safe
-    SLEEP_SEC = 3.0       # recommended: ~3s between calls
-    # !! IMPORTANT: Update your email address below to comply with arXiv's policy !!
-    UA = "rl-mv-weaning-review/0.1 (mailto:your_email@example.com)"
-
-    headers = {"User-Agent": UA}
-    ns = {"opensearch": "http://a9.com/-/spec/opensearch/1.1/"}
-
-    def fetch_query(q):
-        """Fetch all pages for a given query; return list of {start, xml} pages."""
-        r0 = requests.get(
-            BASE,
-            params={"search_query": q, "start": 0, "max_results": 1},
-            headers=headers, timeout=60
-        )
-        r0.raise_for_status()
-        root = ET.fromstring(r0.text)
-        total_el = root.find("opensearch:totalResults", ns)
-        total = int(total_el.text) if total_el is not None else 0
-        pages = []
-        if total == 0:
-            print(f'arXiv query returned 0: {q}')
+def fetch_arxiv():
+    """arXiv Atom pages for each targeted query (plus fallback) → arxiv_all.json."""
+    try:
+        BASE = "http://export.arxiv.org/api/query"
+        # Keep original arXiv query structure, which is already quite robust for keyword searching
+        QUERIES = [
+            'all:"reinforcement learning" AND all:"mechanical ventilation" AND all:wean',
+            'all:"reinforcement learning" AND all:"mechanical ventilation" AND all:extubat',
+            'all:"reinforcement learning" AND all:"mechanical ventilation" AND all:"spontaneous breathing trial"',
+            'all:"reinforcement learning" AND all:ventilator AND all:wean',
+            'all:"reinforcement learning" AND all:ventilator AND all:extubat',
+        ]
+        FALLBACK = 'all:"reinforcement learning" AND (all:"mechanical ventilation" OR all:ventilator)'
+
+        MAX_RESULTS = 200     # arXiv allows up to 300, but 200 is safe
+
+        ns = {"atom": "http://www.w3.org/2005/Atom", "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
+              "arxiv": "http://arxiv.org/schemas/atom"}
+        ATOM_ENTRY = "{http://www.w3.org/2005/Atom}entry"
+        lxml = hasattr(ET, "LXML_VERSION")
+        TOTAL_RESULTS = "{http://a9.com/-/spec/opensearch/1.1/}totalResults"
+
+        def parse_page(r):
+            """
+            Parse a streamed Atom response into (totalResults, entries), keeping only
+            the entry fields the normalizer uses; each <entry> subtree is freed once
+            read, so a page is never held as raw XML or as a full tree.
+            """
+            r.raw.decode_content = True  # undo gzip on the socket stream
+            tag_filter = {"tag": (ATOM_ENTRY, TOTAL_RESULTS)} if lxml else {}
+            total, entries = 0, []
+            for _, e in ET.iterparse(r.raw, events=("end",), **tag_filter):
+                if e.tag == TOTAL_RESULTS:
+                    total = int(e.text or 0)
+                    continue
+                if e.tag != ATOM_ENTRY:
+                    continue
+                entries.append({
+                    "id": (e.findtext("atom:id", default="", namespaces=ns) or "").strip(),
+                    "title": (e.findtext("atom:title", default="", namespaces=ns) or "").strip(),
+                    "summary": (e.findtext("atom:summary", default="", namespaces=ns) or "").strip(),
+                    "authors": [a.findtext("atom:name", default="", namespaces=ns) for a in e.findall("atom:author", ns)],
+                    "published": e.findtext("atom:published", default="", namespaces=ns) or "",
+                    "doi": next((d.text.strip() for d in reversed(e.findall("arxiv:doi", ns)) if d.text), None),
+                })
+                e.clear()
+                if lxml:
+                    while e.getprevious() is not None:
+                        del e.getparent()[0]
+            return total, entries
+
+        def fetch_page(q, start):
+            page_params = {"search_query": q, "start": start, "max_results": MAX_RESULTS}
+            pace(ARXIV_LIMIT, BASE, page_params)
+            with SESSION.get(
+                BASE,
+                params=page_params,
+                timeout=60, stream=True
+            ) as r:
+                r.raise_for_status()
+                return parse_page(r)
+
+        def fetch_query(q):
+            """Fetch all pages for a given query; return list of {start, entries} pages."""
+            # the first full page also carries totalResults, so no separate max_results=1 probe
+            total, entries = fetch_page(q, 0)
+            if total == 0:
+                print(f'arXiv query returned 0: {q}')
+                return [], total
+            pages = [{"query": q, "start": 0, "entries": entries}]
+            print(f"arXiv fetched: q='{q}' start=0 count<= {MAX_RESULTS}")
+
+            num_pages = math.ceil(total / MAX_RESULTS)
+            for p in range(1, num_pages):
+                start = p * MAX_RESULTS
+                _, entries = fetch_page(q, start)
+                pages.append({"query": q, "start": start, "entries": entries})
+                print(f"arXiv fetched: q='{q}' start={start} count<= {MAX_RESULTS}")
             return pages, total
 
-        num_pages = math.ceil(total / MAX_RESULTS)
-        for p in range(num_pages):
-            start = p * MAX_RESULTS
-            r = requests.get(
-                BASE,
-                params={"search_query": q, "start": start, "max_results": MAX_RESULTS},
-                headers=headers, timeout=60
-            )
-            r.raise_for_status()
-            pages.append({"query": q, "start": start, "xml": r.text})
-            print(f"arXiv fetched: q='{q}' start={start} count<= {MAX_RESULTS}")
-            time.sleep(SLEEP_SEC)
-        return pages, total
-
-    all_pages = []
-    totals = []
-    for q in QUERIES:
-        pages, total = fetch_query(q)
-        totals.append({"query": q, "total": total})
-        all_pages.extend(pages)
-
-    if all(t["total"] == 0 for t in totals):
-        print("All targeted arXiv queries returned 0. Trying broader fallback…")
-        pages, total = fetch_query(FALLBACK)
-        totals.append({"query": FALLBACK, "total": total})
-        all_pages.extend(pages)
-
-    save_json("arxiv_all.json", {
-        "queries": QUERIES,
-        "fallback_query": FALLBACK,
-        "max_results_per_page": MAX_RESULTS,
-        "pages_fetched": len(all_pages),
-        "totals_reported": totals,
-        "pages": all_pages
-    })
-except Exception as e:
-    save_text("arxiv_ERROR.txt", str(e))
+        # The targeted queries overlap heavily: keep each paper (versionless id) only
+        # under the first query, in QUERIES order, that returned it.
+        VERSION_RX = re.compile(r"v\d+$")
+        seen = set()
+
+        def drop_seen(pages):
+            for page in pages:
+                kept = []
+                for it in page["entries"]:
+                    key = VERSION_RX.sub("", it["id"]) or it["title"]
+                    if key not in seen:
+                        seen.add(key)
+                        kept.append(it)
+                page["entries"] = kept
+            return pages
+
+        all_pages = []
+        totals = []
+        # queries overlap their round-trips; map() keeps QUERIES order in the output
+        with ThreadPoolExecutor(max_workers=len(QUERIES)) as pool:
+            for q, (pages, total) in zip(QUERIES, pool.map(fetch_query, QUERIES)):
+                totals.append({"query": q, "total": total})
+                all_pages.extend(drop_seen(pages))
+
+        if all(t["total"] == 0 for t in totals):
+            print("All targeted arXiv queries returned 0. Trying broader fallback…")
+            pages, total = fetch_query(FALLBACK)
+            totals.append({"query": FALLBACK, "total": total})
+            all_pages.extend(drop_seen(pages))
+
+        save_json("arxiv_all.json", {
+            "queries": QUERIES,
+            "fallback_query": FALLBACK,
+            "max_results_per_page": MAX_RESULTS,
+            "pages_fetched": len(all_pages),
+            "totals_reported": totals,
+            "pages": all_pages
+        })
+    except Exception as e:
+        save_text("arxiv_ERROR.txt", str(e))
 
 # -------------------- Scopus --------------------
-try:
-    # accept either Scopus_API_KEY or SCOPUS_API_KEY
-    Scopus_API_KEY = os.getenv("Scopus_API_KEY") or os.getenv("SCOPUS_API_KEY")
-    if not Scopus_API_KEY:
-        raise RuntimeError("SCOPUS_API_KEY / Scopus_API_KEY env var not set.")
-    INSTTOKEN = os.getenv("SCOPUS_INSTTOKEN") or os.getenv("Scopus_INSTTOKEN")  # optional
-
-    headers = {"X-ELS-APIKey": Scopus_API_KEY, "Accept": "application/json"}
-    if INSTTOKEN:
-        headers["X-ELS-Insttoken"] = INSTTOKEN
-
-    query = 'TITLE-ABS-KEY("reinforcement learning" AND ("mechanical ventilation" OR ventilator OR "ventilatory support") AND (wean* OR extubat* OR "spontaneous breathing trial" OR SBT))'
-    BASE = "https://api.elsevier.com/content/search/scopus"
-    COUNT = 25          # typical page size
-    start, pages, all_entries = 0, 0, []
-    total_reported = None
-    MAX_PAGES = 20      # safety cap to avoid hammering API
-
-    while True:
-        r = get_with_retry(
-            BASE,
-            headers=headers,
-            params={"query": query, "start": start, "count": COUNT},
-            timeout=30,
-        )
-        data = r.json()
-        if total_reported is None:
-            total_reported = int((data.get("search-results", {}) or {}).get("opensearch:totalResults", "0") or "0")
-            print("Scopus total (reported):", total_reported)
-        entries = (data.get("search-results", {}) or {}).get("entry", []) or []
-        all_entries.extend(entries)
-        pages += 1
-        print(f"Scopus page {pages} (start={start}) fetched: {len(entries)}")
-
-        # stop conditions
-        if len(entries) < COUNT:
-            break
-        if pages >= MAX_PAGES:
-            print(f"Reached Scopus MAX_PAGES={MAX_PAGES}, stopping to avoid rate limit.")
-            break
-
-        start += COUNT
-        time.sleep(1.0)
-
-    save_json("scopus_all.json", {
-        "query": query,
-        "count_per_page": COUNT,
-        "pages_fetched": pages,
-        "total_reported": total_reported,
-        "total_items_concat": len(all_entries),
-        "entries": all_entries
-    })
-except Exception as e:
-    save_text("scopus_ERROR.txt", str(e))
+def fetch_scopus():
+    """Scopus search (needs SCOPUS_API_KEY) → scopus_all.json."""
+    try:
+        # accept either Scopus_API_KEY or SCOPUS_API_KEY
+        Scopus_API_KEY = os.getenv("Scopus_API_KEY") or os.getenv("SCOPUS_API_KEY")
+        if not Scopus_API_KEY:
+            raise RuntimeError("SCOPUS_API_KEY / Scopus_API_KEY env var not set.")
+        INSTTOKEN = os.getenv("SCOPUS_INSTTOKEN") or os.getenv("Scopus_INSTTOKEN")  # optional
+
+        headers = {"X-ELS-APIKey": Scopus_API_KEY, "Accept": "application/json"}
+        if INSTTOKEN:
+            headers["X-ELS-Insttoken"] = INSTTOKEN
+
+        query = 'TITLE-ABS-KEY("reinforcement learning" AND ("mechanical ventilation" OR ventilator OR "ventilatory support") AND (wean* OR extubat* OR "spontaneous breathing trial" OR SBT))'
+        BASE = "https://api.elsevier.com/content/search/scopus"
+        COUNT = 25          # typical page size
+        start, pages, all_entries = 0, 0, []
+        total_reported = None
+        MAX_PAGES = 20      # safety cap to avoid hammering API
+        base_params = {"query": query, "count": COUNT}
+
+        while True:
+            r = get_with_retry(
+                BASE,
+                headers=headers,
+                params={**base_params, "start": start},
+                timeout=30,
+                limiter=SCOPUS_LIMIT,
+            )
+            data = json_loads(r.content)
+            if total_reported is None:
+                total_reported = int((data.get("search-results", {}) or {}).get("opensearch:totalResults", "0") or "0")
+                print("Scopus total (reported):", total_reported)
+            entries = (data.get("search-results", {}) or {}).get("entry", []) or []
+            all_entries.extend(entries)
+            pages += 1
+            print(f"Scopus page {pages} (start={start}) fetched: {len(entries)}")
+
+            # stop conditions
+            if len(entries) < COUNT:
+                break
+            if pages >= MAX_PAGES:
+                print(f"Reached Scopus MAX_PAGES={MAX_PAGES}, stopping to avoid rate limit.")
+                break
+
+            start += COUNT
+
+        save_json("scopus_all.json", {
+            "query": query,
+            "count_per_page": COUNT,
+            "pages_fetched": pages,
+            "total_reported": total_reported,
+            "total_items_concat": len(all_entries),
+            "entries": all_entries
+        })
+    except Exception as e:
+        save_text("scopus_ERROR.txt", str(e))
 
 # -------------------- Web of Science (Unchanged from original commented block) --------------------
-try:
-    WOS_API_KEY = os.getenv("WOS_API_KEY") or ""
-    if not WOS_API_KEY:
-        raise RuntimeError("WOS_API_KEY env var not set.")
-    usrQuery = 'TS=("reinforcement learning" AND ("mechanical ventilation" OR ventilator) AND (wean* OR extubat* OR "spontaneous breathing trial"))'
-
-    BASE = "https://api.clarivate.com/api/wos"
-    COUNT = 100        # often up to 100 per page
-    first, pages, all_pages = 1, 0, []
-    total_reported = None
-    MAX_PAGES = 10     # safety cap for WOS
-
-    while True:
-        r = get_with_retry(
-            BASE,
-            headers={"X-ApiKey": WOS_API_KEY},
-            params={"databaseId": "WOS", "usrQuery": usrQuery, "count": COUNT, "firstRecord": first},
-            timeout=60,
-        )
-        data = r.json()
-        all_pages.append({"firstRecord": first, "payload": data})
-        pages += 1
-
-        # total records reported (varies by deployment)
-        if total_reported is None:
-            qres = (data.get("QueryResult") or {})
-            total_reported = qres.get("RecordsFound") or (data.get("Data") or {}).get("RecordsFound")
-            print("Web of Science total (reported):", total_reported)
-
-        # infer how many were returned on this page
-        returned = 0
-        recs = (data.get("Data") or {}).get("Records")
-        if isinstance(recs, list):
-            returned = len(recs)
-        print(f"WOS page {pages} (firstRecord={first}) fetched ~{returned}")
-
-        if returned < COUNT:
-            break
-        if pages >= MAX_PAGES:
-            print(f"Reached WOS MAX_PAGES={MAX_PAGES}, stopping to avoid rate limit.")
-            break
-
-        first += COUNT
-        time.sleep(1.0)
-
-    save_json("wos_all.json", {
-        "usrQuery": usrQuery,
-        "count_per_page": COUNT,
-        "pages_fetched": pages,
-        "total_reported": total_reported,
-        "pages": all_pages
-    })
-except Exception as e:
-    save_text("wos_ERROR.txt", str(e))
+def fetch_wos():
+    """Web of Science Expanded search (needs WOS_API_KEY) → wos_all.json."""
+    try:
+        WOS_API_KEY = os.getenv("WOS_API_KEY") or ""
+        if not WOS_API_KEY:
+            raise RuntimeError("WOS_API_KEY env var not set.")
+        usrQuery = 'TS=("reinforcement learning" AND ("mechanical ventilation" OR ventilator) AND (wean* OR extubat* OR "spontaneous breathing trial"))'
+
+        BASE = "https://api.clarivate.com/api/wos"
+        COUNT = 100        # often up to 100 per page
+        first, pages, all_pages = 1, 0, []
+        total_reported = None
+        MAX_PAGES = 10     # safety cap for WOS
+        headers = {"X-ApiKey": WOS_API_KEY}
+        base_params = {"databaseId": "WOS", "usrQuery": usrQuery, "count": COUNT}
+
+        while True:
+            r = get_with_retry(
+                BASE,
+                headers=headers,
+                params={**base_params, "firstRecord": first},
+                timeout=60,
+                limiter=WOS_LIMIT,
+            )
+            data = json_loads(r.content)
+            all_pages.append({"firstRecord": first, "payload": data})
+            pages += 1
+
+            # total records reported (varies by deployment)
+            if total_reported is None:
+                qres = (data.get("QueryResult") or {})
+                total_reported = qres.get("RecordsFound") or (data.get("Data") or {}).get("RecordsFound")
+                print("Web of Science total (reported):", total_reported)
+
+            # infer how many were returned on this page
+            returned = 0
+            recs = (data.get("Data") or {}).get("Records")
+            if isinstance(recs, list):
+                returned = len(recs)
+            print(f"WOS page {pages} (firstRecord={first}) fetched ~{returned}")
+
+            if returned < COUNT:
+                break
+            if pages >= MAX_PAGES:
+                print(f"Reached WOS MAX_PAGES={MAX_PAGES}, stopping to avoid rate limit.")
+                break
+
+            first += COUNT
+
+        save_json("wos_all.json", {
+            "usrQuery": usrQuery,
+            "count_per_page": COUNT,
+            "pages_fetched": pages,
+            "total_reported": total_reported,
+            "pages": all_pages
+        })
+    except Exception as e:
+        save_text("wos_ERROR.txt", str(e))
 
 # -------------------- Google Scholar via SerpAPI (multi-page → single JSON) --------------------
-try:
-    SerpAPI_KEY = os.getenv("SerpAPI_KEY")
-    if not SerpAPI_KEY:
-        raise RuntimeError("SerpAPI_KEY env var not set.")
-
-    # Expanded Google Scholar search (similar expansion as OpenAlex/S2)
-    q = ('("reinforcement learning" OR "Q-learning" OR PPO OR DQN OR "markov decision" OR MDP) '
-         'AND ("mechanical ventilation" OR ventilator OR "ventilatory support") '
-         'AND (wean OR extubat OR "spontaneous breathing trial")')
-    print("Google Scholar Search Term:\n", q)
-
-    BASE = "https://serpapi.com/search.json"
-    NUM_PER_PAGE = 20          # Google Scholar max is 20 per page
-    PAGES = 10                 # requested pages
-    SLEEP_SEC = 1.0            # polite pacing
-
-    all_items = []
-    pages_fetched = 0
-
-    for page in range(PAGES):
-        start = page * NUM_PER_PAGE  # 0,20,40,60,80,...
-        params = {
-            "engine": "google_scholar",
-            "q": q,
-            "num": NUM_PER_PAGE,
-            "start": start,
-            "api_key": SerpAPI_KEY,
+def fetch_google_scholar():
+    """Google Scholar via SerpAPI (needs SerpAPI_KEY) → google_scholar_all.json."""
+    try:
+        SerpAPI_KEY = os.getenv("SerpAPI_KEY")
+        if not SerpAPI_KEY:
+            raise RuntimeError("SerpAPI_KEY env var not set.")
+
+        # Expanded Google Scholar search (same spec as OpenAlex/S2)
+        q = build_query(" OR ", " AND ")
+        print("Google Scholar Search Term:\n", q)
+
+        BASE = "https://serpapi.com/search.json"
+        NUM_PER_PAGE = 20          # Google Scholar max is 20 per page
+        PAGES = 10                 # requested pages
+        MAX_WORKERS = 2            # pages in flight at once, paced by SERPAPI_LIMIT
+        # constant part of the request; only "start" changes per page
+        base_params = {"engine": "google_scholar", "q": q, "num": NUM_PER_PAGE, "api_key": SerpAPI_KEY}
+
+        def fetch_page(page):
+            start = page * NUM_PER_PAGE  # 0,20,40,60,80,...
+            page_params = {**base_params, "start": start}
+            pace(SERPAPI_LIMIT, BASE, page_params)
+            r = SESSION.get(BASE, params=page_params, timeout=30)
+            r.raise_for_status()
+            data = json_loads(r.content)
+            items = data.get("organic_results", []) or data.get("scholar_results", [])
+            print(f"Google Scholar page {page+1} (start={start}) fetched: {len(items)}")
+            return items
+
+        all_items = []
+        pages_fetched = 0
+
+        stop = RelevanceStop()
+
+        # pages are independent, so overlap their latency; map() keeps page order
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            for items in pool.map(fetch_page, range(PAGES)):
+                all_items.extend(items)
+                pages_fetched += 1
+                if stop.update(it.get("title") for it in items):
+                    print(f"Google Scholar: last {STOP_WINDOW} pages mostly off-topic, stopping early")
+                    pool.shutdown(wait=False, cancel_futures=True)  # pages not yet started are never requested
+                    break
+
+        combined = {
+            "query": q,
+            "num_per_page": NUM_PER_PAGE,
+            "pages_fetched": pages_fetched,
+            "total_items_concat": len(all_items),
+            "items": all_items
         }
-        r = requests.get(BASE, params=params, timeout=30)
-        r.raise_for_status()
-        data = r.json()
-        items = data.get("organic_results", []) or data.get("scholar_results", [])
-        print(f"Google Scholar page {page+1} (start={start}) fetched: {len(items)}")
-        all_items.extend(items)
-        pages_fetched += 1
-        time.sleep(SLEEP_SEC)
-
-    combined = {
-        "query": q,
-        "num_per_page": NUM_PER_PAGE,
-        "pages_fetched": pages_fetched,
-        "total_items_concat": len(all_items),
-        "items": all_items
-    }
-    save_json("google_scholar_all.json", combined)
-
-except Exception as e:
-    save_text("google_scholar_ERROR.txt", str(e))
+        save_json("google_scholar_all.json", combined)
+
+    except Exception as e:
+        save_text("google_scholar_ERROR.txt", str(e))
+
+# -------------------- run all sources --------------------
+# Each source talks to a different host and catches its own errors, so they run
+# side by side; within a source, pagination and pacing stay sequential as before.
+FETCHERS = [fetch_pubmed, fetch_openalex, fetch_semantic_scholar, fetch_arxiv,
+            fetch_scopus, fetch_wos, fetch_google_scholar]
+
+with ThreadPoolExecutor(max_workers=len(FETCHERS)) as pool:
+    for fut in [pool.submit(f) for f in FETCHERS]:
+        fut.result()
 
 print("\nDone. Raw outputs saved in ./paper_list/")
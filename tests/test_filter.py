@@ -0,0 +1,153 @@
+import importlib
+import json
+
+import pytest
+
+@pytest.fixture(params=["filter", "paper_filter"])
+def mod(request):
+    return importlib.import_module(request.param)
+
+TITLE = "Reinforcement learning for weaning from mechanical ventilation in the ICU"
+
+def test_near_duplicates_with_different_years_stay_apart(mod):
+    a = mod.norm_record("openalex", "W1", TITLE, year=2019)
+    b = mod.norm_record("google_scholar", "G1", TITLE, year=2020)
+    assert len(mod.collapse_near_duplicates([a, b], threshold=0.85)) == 2
+
+def test_near_duplicates_fold_when_a_year_is_missing(mod):
+    a = mod.norm_record("openalex", "W1", TITLE, year=2019)
+    b = mod.norm_record("google_scholar", "G1", TITLE + ".")
+    assert len(mod.collapse_near_duplicates([a, b], threshold=0.85)) == 1
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.content = payload
+
+    def raise_for_status(self):
+        pass
+
+@pytest.fixture
+def offline(mod, monkeypatch, tmp_path):
+    """Fresh on-disk cache; S2 batch answers from `offline.s2` in request order."""
+    answers = {}
+    def fake_request(method, url, limiter, **kwargs):
+        ids = mod.json_loads(kwargs["data"])["ids"]
+        return FakeResponse(mod.json_dumps([answers.get(i) for i in ids]))
+    monkeypatch.setattr(mod, "CACHE", mod.AbstractCache(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(mod, "request_with_retry", fake_request)
+    return answers
+
+PAPER_ID = "0123456789abcdef0123456789abcdef01234567"
+
+def test_s2_paper_id_lookup_resolves_when_s2_knows_a_pmid(mod, offline):
+    offline[PAPER_ID] = {"paperId": PAPER_ID, "abstract": "Weaning policy learned with RL.",
+                         "externalIds": {"PubMed": "999"}}
+    row = mod.norm_record("semantic_scholar", PAPER_ID, TITLE, year=2021)
+    row_keys = []
+    pmids, dois, openalex_ids, arxiv_ids, s2_ids = mod.collect_ids([row], row_keys)
+    assert s2_ids == {PAPER_ID}
+    index = mod.build_abstract_index({}, mod.s2_batch_by_ids(sorted(s2_ids)), {}, {})
+    assert mod.lookup_abstract(index, row_keys[0]) == "Weaning policy learned with RL."
+
+def test_doi_less_s2_rows_are_sent_by_an_id_s2_can_resolve(mod, offline):
+    offline["CorpusId:4242"] = {"paperId": PAPER_ID, "abstract": "Found by corpus id."}
+    url = "https://www.semanticscholar.org/paper/" + PAPER_ID
+    rows = [mod.norm_record("semantic_scholar", 4242, TITLE),
+            mod.norm_record("semantic_scholar", url, TITLE + " II", url=url),
+            mod.norm_record("semantic_scholar", TITLE + " III", TITLE + " III")]  # title fallback
+    row_keys = []
+    s2_ids = mod.collect_ids(rows, row_keys)[4]
+    assert s2_ids == {"CorpusId:4242", "URL:" + url}
+    index = mod.build_abstract_index({}, mod.s2_batch_by_ids(sorted(s2_ids)), {}, {})
+    assert [mod.lookup_abstract(index, keys) for keys in row_keys] == ["Found by corpus id.", "", ""]
+
+def test_s2_pmid_lookup_resolves_when_s2_knows_a_doi(mod, offline):
+    offline["PMID:999"] = {"paperId": PAPER_ID, "abstract": "Weaning policy learned with RL.",
+                           "externalIds": {"PubMed": "999", "DOI": "10.1000/xyz"}}
+    row = mod.norm_record("pubmed", "PMID:999", TITLE)
+    row_keys = []
+    mod.collect_ids([row], row_keys)
+    index = mod.build_abstract_index({}, mod.s2_batch_by_ids(["PMID:999"]), {}, {})
+    assert mod.lookup_abstract(index, row_keys[0]) == "Weaning policy learned with RL."
+
+def test_json_line_without_orjson_matches_stdlib_default(mod, monkeypatch):
+    monkeypatch.setattr(mod, "orjson", None)
+    rec = {"title": "Sevrage ventilatoire", "year": 2021, "authors": ["Ä", "B"]}
+    assert mod.json_line(rec) == (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
+
+def test_doi_less_copy_merges_into_doi_record_with_same_title_and_year(mod):
+    published = mod.norm_record("openalex", "W1", TITLE, year=2021, doi="10.1000/ABC")
+    scholar = mod.norm_record("google_scholar", "G1", TITLE.upper(), year=2021)
+    links = mod.link_titles_to_dois([published, scholar])
+    assert mod.dedup_key(scholar, links) == mod.dedup_key(published, links) == "doi:10.1000/abc"
+    assert mod.deduplicate([published, scholar]) == [published]
+
+def test_doi_less_copy_from_another_year_does_not_merge(mod):
+    published = mod.norm_record("openalex", "W1", TITLE, year=2021, doi="10.1000/abc")
+    scholar = mod.norm_record("google_scholar", "G1", TITLE, year=2022)
+    links = mod.link_titles_to_dois([published, scholar])
+    assert mod.dedup_key(scholar, links) != mod.dedup_key(published, links)
+    assert len(mod.deduplicate([published, scholar])) == 2
+
+def test_s2_metadata_without_abstract_fills_pubmed_rows_on_every_run(monkeypatch, tmp_path):
+    mod = importlib.import_module("paper_filter")
+    s2_calls = []
+    def fake_request(method, url, limiter, **kwargs):
+        if method != "POST":  # PubMed EFetch: no abstract for this PMID
+            return FakeResponse(b"<PubmedArticleSet/>")
+        ids = mod.json_loads(kwargs["data"])["ids"]
+        s2_calls.append(ids)
+        return FakeResponse(mod.json_dumps([{"paperId": "abc123", "title": "RL for weaning from mechanical ventilation",
+                                             "year": 2021, "venue": "Crit Care", "abstract": None}
+                                            if i == "PMID:999" else None for i in ids]))
+    monkeypatch.setattr(mod, "CACHE", mod.AbstractCache(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(mod, "request_with_retry", fake_request)
+
+    runs = []
+    for _ in range(2):
+        row = mod.norm_record("pubmed", "PMID:999", url="https://pubmed.ncbi.nlm.nih.gov/999/")
+        mod.enrich_records_with_abstracts([row])
+        runs.append((row["title"], row["year"], row["venue"]))
+    assert runs[0] == runs[1] == ("RL for weaning from mechanical ventilation", 2021, "Crit Care")
+    assert len(s2_calls) == 1  # the second run is served from the cache
+
+def test_pubmed_pmid_joins_the_openalex_record_listing_it(mod):
+    openalex = mod.norm_record("openalex", "https://openalex.org/W1", TITLE, year=2021, doi="10.1000/abc",
+                               ids=mod.xref_ids(pmid="https://pubmed.ncbi.nlm.nih.gov/999"))
+    pubmed = mod.norm_record("pubmed", "PMID:999", ids=mod.xref_ids("999"))
+    other = mod.norm_record("pubmed", "PMID:1000", ids=mod.xref_ids("1000"))
+    clusters = mod.cluster_by_ids([openalex, pubmed, other])
+    assert clusters == [[openalex, pubmed], [other]]
+
+def test_clusters_union_transitively_across_doi_pmcid_and_arxiv(mod):
+    s2 = mod.norm_record("semantic_scholar", "abc", TITLE, doi="10.1000/abc",
+                         ids=mod.xref_ids(pmcid="PMC123", arxiv="2101.00001"))
+    openalex = mod.norm_record("openalex", "W1", TITLE, doi="10.1000/ABC")
+    europe = mod.norm_record("scopus", "S1", TITLE, ids=mod.xref_ids(pmcid="https://www.ncbi.nlm.nih.gov/pmc/articles/PMC123/"))
+    preprint = mod.norm_record("arxiv", "http://arxiv.org/abs/2101.00001v2", TITLE, ids=mod.xref_ids(arxiv="2101.00001v2"))
+    # openalex and preprint share nothing directly; both reach the cluster through s2
+    clusters = mod.cluster_by_ids([openalex, preprint, europe, s2])
+    assert len(clusters) == 1 and len(clusters[0]) == 4
+
+def test_canonical_record_prefers_doi_then_longer_title_then_source_priority(mod):
+    pubmed = mod.norm_record("pubmed", "PMID:999", TITLE + " in adults", ids=mod.xref_ids("999"))
+    scholar = mod.norm_record("google_scholar", "G1", TITLE, doi="10.1000/abc")
+    openalex = mod.norm_record("openalex", "W1", TITLE, doi="10.1000/abc")
+    assert mod.canonical_record([pubmed, scholar, openalex]) is openalex
+    assert mod.canonical_record([pubmed, mod.norm_record("openalex", "W2", TITLE)])["source"] == "pubmed"
+
+def test_s2_is_asked_for_an_openalex_doi_only_when_openalex_has_no_abstract(mod, monkeypatch):
+    s2_requests = []
+    monkeypatch.setattr(mod, "fetch_openalex_abstracts", lambda wids: {"W1": "OpenAlex abstract."})
+    monkeypatch.setattr(mod, "fetch_pubmed_abstracts", lambda pmids: {})
+    monkeypatch.setattr(mod, "fetch_arxiv_abstracts", lambda ids: {})
+    monkeypatch.setattr(mod, "s2_batch_by_ids", lambda ids: s2_requests.extend(ids) or {})
+    rows = [mod.norm_record("openalex", "https://openalex.org/W1", TITLE, doi="10.1000/has-abstract"),
+            mod.norm_record("openalex", "https://openalex.org/W2", TITLE + " II", doi="10.1000/no-abstract"),
+            mod.norm_record("openalex", "https://openalex.org/W3", TITLE + " III", doi="10.1000/shared"),
+            mod.norm_record("crossref", "C3", TITLE + " III", doi="10.1000/shared")]
+    openalex_dois = {}
+    ids = mod.collect_ids(rows, None, openalex_dois)
+    assert openalex_dois == {"W1": "10.1000/has-abstract", "W2": "10.1000/no-abstract"}
+    mod.fetch_abstract_sources(*ids, openalex_dois)
+    assert sorted(s2_requests) == ["DOI:10.1000/no-abstract", "DOI:10.1000/shared"]
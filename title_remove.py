@@ -32,10 +32,15 @@ def main():
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     # --- Patterns ---
-    rx_review   = re.compile(r"\breview\b", re.IGNORECASE)
-    rx_ml       = re.compile(r"\bmachine[-\s]?learning\b", re.IGNORECASE)
-    rx_deep_l   = re.compile(r"\bdeep\s+learning\b", re.IGNORECASE)
-    rx_deep_rl  = re.compile(r"\bdeep\s+reinforcement\s+learning\b", re.IGNORECASE)
+    # The exclusion terms share one alternation: a single finditer pass per title
+    # reports every term present by its group name.
+    rx_exclude = re.compile(
+        r"(?P<review>\breview\b)"
+        r"|(?P<ml>\bmachine[-\s]?learning\b)"
+        r"|(?P<deep_rl>\bdeep\s+reinforcement\s+learning\b)"
+        r"|(?P<deep_l>\bdeep\s+learning\b)",
+        re.IGNORECASE,
+    )
 
     # Mechanical-ventilation keywords required in title
     mv_title_terms = [
@@ -54,35 +59,40 @@ def main():
     rx_mv_title = re.compile("|".join(mv_title_terms), re.IGNORECASE)
 
     kept_rows = []
-    removed_rows = []  # list of (row, [reasons])
+    removed_rows = []  # list of (title, [reasons])
     reason_counts = Counter()
 
     with in_path.open("r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames or []
+        # Plain lists rather than DictReader: only the title column is read, and
+        # kept rows are written back untouched.
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
         if not fieldnames:
             raise RuntimeError("Empty or invalid CSV.")
-        if "title" not in [c.lower() for c in fieldnames]:
+        # Position of the title column (first match wins)
+        columns = {c.lower(): i for i, c in reversed(list(enumerate(fieldnames)))}
+        title_idx = columns.get("title")
+        if title_idx is None:
             raise RuntimeError("CSV must contain a 'title' column.")
 
-        # Preserve exact key for title column from the file
-        title_key = next(c for c in fieldnames if c.lower() == "title")
-
         for row in reader:
-            title = (row.get(title_key) or "").strip()
+            if not row:
+                continue  # blank line (DictReader skipped these too)
+            title = row[title_idx].strip() if title_idx < len(row) else ""
             title_lc = title.lower()
             reasons = []
+            found = {m.lastgroup for m in rx_exclude.finditer(title)}
 
             # 1) 'review'
-            if rx_review.search(title):
+            if "review" in found:
                 reasons.append("review")
 
             # 2) 'machine learning'
-            if rx_ml.search(title):
+            if "ml" in found:
                 reasons.append("machine learning")
 
             # 3) 'deep learning' (unless also 'deep reinforcement learning')
-            if rx_deep_l.search(title) and not rx_deep_rl.search(title):
+            if "deep_l" in found and "deep_rl" not in found:
                 reasons.append("deep learning (not DRL)")
 
             # 4) must include MV keyword in TITLE
@@ -90,7 +100,7 @@ def main():
                 reasons.append("no MV keyword in title")
 
             if reasons:
-                removed_rows.append((row, reasons))
+                removed_rows.append((title, reasons))
                 for r in set(reasons):
                     reason_counts[r] += 1
             else:
@@ -101,8 +111,8 @@ def main():
     if not removed_rows:
         print("(none)")
     else:
-        for row, reasons in removed_rows:
-            print(f"REMOVED [{'; '.join(reasons)}]: {row.get('title','').strip()}")
+        for title, reasons in removed_rows:
+            print(f"REMOVED [{'; '.join(reasons)}]: {title}")
 
     # --- Summary ---
     print("\n=== Summary ===")
@@ -117,10 +127,9 @@ def main():
 
     # --- Write output ---
     with out_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in kept_rows:
-            writer.writerow(r)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(kept_rows)
 
 if __name__ == "__main__":
     main()